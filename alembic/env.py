@@ -1,8 +1,9 @@
+import os
 import sys
 from logging.config import fileConfig
 
 from alembic import context
-from sqlalchemy import engine_from_config, pool
+from sqlalchemy import engine_from_config, pool, text
 
 from schema_propagation.config import get_settings
 
@@ -11,7 +12,8 @@ config = context.config
 
 # Inject database URL from our settings (.env)
 settings = get_settings()
-config.set_main_option("sqlalchemy.url", settings.direct_dsn)
+# ConfigParser interpolates %, so escape the percent-encoded credentials
+config.set_main_option("sqlalchemy.url", settings.migration_dsn.replace("%", "%%"))
 
 # Interpret the config file for Python logging.
 if config.config_file_name is not None:
@@ -36,18 +38,48 @@ def run_migrations_offline() -> None:
 
 
 def run_migrations_online() -> None:
-    """Run migrations in 'online' mode."""
+    """
+    Run migrations in 'online' mode.
+
+    The engine keeps SQLAlchemy's compiled-statement cache on. To check that data
+    migrations actually hit it, set the ``sqlalchemy.engine`` logger to INFO in
+    alembic.ini: each statement is logged with ``[cached since ...]``,
+    ``[generated in ...]`` or ``[no key ...]``; ``[no key]`` means the statement
+    can't be cached and is recompiled every time.
+
+    Don't reuse a loader option object to build further chains
+    (``pages = joinedload(Book.pages); pages.joinedload(...)``): cache-key
+    generation for shared chains grows quadratically. Re-root each chain instead,
+    e.g. ``joinedload(Book.pages).joinedload(Page.notes)``.
+    """
     connectable = engine_from_config(
         config.get_section(config.config_ini_section),
         prefix="sqlalchemy.",
-        poolclass=pool.NullPool,
+        poolclass=pool.QueuePool,
+        pool_size=5,
+        max_overflow=0,
+        query_cache_size=1200,
+        echo=False,
     )
 
     with connectable.connect() as connection:
+        if os.environ.get("SCHEMA_PROP_FAST_MIGRATE") == "1":
+            # Commits return once WAL is in the buffer, not on disk. This is only
+            # safe because a crash mid-migration means re-running the migration
+            # anyway. Set at session level rather than SET LOCAL: with
+            # transaction_per_migration each revision gets its own transaction.
+            connection.execute(text("SET synchronous_commit = OFF"))
+            connection.execute(text("SET maintenance_work_mem = '1GB'"))
+            connection.commit()
+
         context.configure(
             connection=connection,
             target_metadata=target_metadata,
             compare_type=True,
+            # One transaction per revision so a multi-revision upgrade doesn't hold
+            # a single giant transaction; long data migrations can additionally page
+            # through rows with schema_propagation.alembic_utils.paginated().
+            transaction_per_migration=True,
         )
 
         with context.begin_transaction():
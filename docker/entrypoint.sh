@@ -1,6 +1,13 @@
 #!/bin/sh
+# Shared metrics directory for all uvicorn workers; stale files from a
+# previous run would be summed into the new counters, so start empty
+export PROMETHEUS_MULTIPROC_DIR=${PROMETHEUS_MULTIPROC_DIR:-/tmp/prometheus}
+rm -rf "$PROMETHEUS_MULTIPROC_DIR"
+mkdir -p "$PROMETHEUS_MULTIPROC_DIR"
+
 exec uvicorn schema_propagation.api:app \
     --host 0.0.0.0 \
     --port ${APP_PORT:-8000} \
     --workers ${UVICORN_WORKERS:-1} \
+    --loop uvloop \
     --reload
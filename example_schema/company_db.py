@@ -1,12 +1,61 @@
 from sqlalchemy import (
-    Column, String, DateTime, JSON, Integer, Boolean, Float, Date, ForeignKey,
-    UniqueConstraint, Numeric, CheckConstraint, Index, Text
+    event, Column, Computed, String, DateTime, Integer, Boolean, Float, ForeignKey, Enum,
+    UniqueConstraint, Numeric, CheckConstraint, FetchedValue, Index, Text, Table, select
 )
-from sqlalchemy.orm import declarative_base, relationship
+from sqlalchemy.dialects.postgresql import CITEXT, DOMAIN, JSONB
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 from sqlalchemy.sql import func, text
+import datetime as dt
+from decimal import Decimal
+from typing import Any
 import enum
 
-Base = declarative_base()
+from schema_propagation.cache import CachedLookupMixin, cached
+
+class Base(DeclarativeBase):
+    pass
+
+# One trigger function keeps updated_at current for every TimestampMixin table, so
+# UPDATEs don't carry a client-side onupdate expression
+Base.metadata.info["ddl"] = [
+    """CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$
+BEGIN
+    NEW.updated_at = now();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;""",
+]
+
+class TimestampMixin:
+    """
+    created_at/updated_at columns; updated_at is maintained by the set_updated_at() trigger.
+    Declarative appends mixin columns after the class's own, so sort_order moves these
+    8-byte timestamps to the front of the table where they need no alignment padding.
+    """
+    created_at: Mapped[dt.datetime | None] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), sort_order=-1
+    )
+    # server_onupdate: the ORM expires the value after an UPDATE flush and reloads it
+    updated_at: Mapped[dt.datetime | None] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), server_onupdate=FetchedValue(), sort_order=-1
+    )
+
+@event.listens_for(TimestampMixin, "instrument_class", propagate=True)
+def _add_updated_at_trigger(mapper, cls):
+    table = mapper.local_table
+    if "updated_at" not in table.c:
+        return  # joined-inheritance subclasses keep the timestamps on the parent table
+    # DROP + CREATE rather than CREATE OR REPLACE TRIGGER, which needs PostgreSQL 14
+    table.info.setdefault("ddl", []).extend([
+        f"DROP TRIGGER IF EXISTS {table.name}_set_updated_at ON {table.name};",
+        f"CREATE TRIGGER {table.name}_set_updated_at\n"
+        f"BEFORE UPDATE ON {table.name}\n"
+        "FOR EACH ROW EXECUTE FUNCTION set_updated_at();",
+    ])
+
+# Non-negative money amount; the domain CHECK runs when a value is cast to the type
+# instead of as a per-table constraint
+BudgetAmount = DOMAIN('budget_amount', Numeric(15, 2), check='VALUE >= 0')
 
 class ReportingSystem(enum.Enum):
     """Enum for reporting system types. This is used for type safety in Python code.
@@ -18,165 +67,233 @@ class ReportingSystem(enum.Enum):
 """
 CompanyConfigs table stores various configurations for each company.
 """
-class CompanyConfigs(Base):
+class CompanyConfigs(TimestampMixin, Base):
     __tablename__ = 'company_configs'
-    id = Column(Integer, primary_key=True)
-    category = Column(String(50), nullable=False)  # 'company_profile_config' or 'application_config'
-    type = Column(String(50), nullable=False)  # e.g., 'PS', 'Vendor', 'Procurer'
-    data = Column(JSON, nullable=False)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    id: Mapped[int] = mapped_column(primary_key=True)
+    category: Mapped[str] = mapped_column(String(50))  # 'company_profile_config' or 'application_config'
+    type: Mapped[str] = mapped_column(String(50))  # e.g., 'PS', 'Vendor', 'Procurer'
+    data: Mapped[Any] = mapped_column(JSONB, nullable=False)
+
+    # jsonb_path_ops GIN indexes serve containment (@>) lookups and are smaller than jsonb_ops
+    __table_args__ = (
+        Index('idx_company_configs_data_gin', 'data', postgresql_using='gin', postgresql_ops={'data': 'jsonb_path_ops'}),
+    )
+
+"""
+company_configs_flat materialized view flattens the hot application_config fields out of
+CompanyConfigs.data, so request paths read typed columns instead of parsing JSON.
+A statement-level trigger on company_configs refreshes it (the table is small and rarely written)
+CONCURRENTLY, using the unique index on id, so readers of the view aren't blocked while the
+writing transaction is open; concurrent writers still serialize on the refresh.
+"""
+company_configs_flat = Table(
+    'company_configs_flat', Base.metadata,
+    Column('id', Integer, primary_key=True),
+    Column('type', String(50)),
+    Column('app_version', Text),
+    Column('max_users', Integer),
+    Column('logo_url', Text),
+    Index('idx_ccf_app_version', 'app_version'),
+    info={
+        "is_materialized": True,
+        "definition": """
+            SELECT id,
+                   type,
+                   data->>'application_version' AS app_version,
+                   CASE WHEN data->>'max_users' ~ '^[0-9]+$' THEN (data->>'max_users')::int END AS max_users,
+                   data->>'logo_url' AS logo_url
+            FROM company_configs
+            WHERE category = 'application_config'
+        """,
+        "ddl": [
+            """CREATE OR REPLACE FUNCTION refresh_company_configs_flat() RETURNS trigger AS $$
+BEGIN
+    REFRESH MATERIALIZED VIEW CONCURRENTLY company_configs_flat;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;""",
+            "DROP TRIGGER IF EXISTS company_configs_flat_refresh ON company_configs;",
+            """CREATE TRIGGER company_configs_flat_refresh
+AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON company_configs
+FOR EACH STATEMENT EXECUTE FUNCTION refresh_company_configs_flat();""",
+        ],
+    },
+)
+
+class CompanyConfigsFlat(Base):
+    """Read-only mapping over company_configs_flat; write to CompanyConfigs instead."""
+    __table__ = company_configs_flat
 
 """
 CompanyProfile table stores the profile data for each company.
 """
-class CompanyProfile(Base):
+class CompanyProfile(TimestampMixin, Base):
     __tablename__ = 'company_profiles'
-    id = Column(Integer, primary_key=True)
-    variable = Column(String(50), nullable=False)
-    type = Column(String(50), nullable=False)  # e.g., 'profile_template', 'settings', 'styling', 'logo' etc.
-    value = Column(JSON, nullable=False)
-    form_completed = Column(Boolean, default=False)  # Flag to indicate if the profile form is completed
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    id: Mapped[int] = mapped_column(primary_key=True)
+    variable: Mapped[str] = mapped_column(String(50))
+    type: Mapped[str] = mapped_column(String(50))  # e.g., 'profile_template', 'settings', 'styling', 'logo' etc.
+    value: Mapped[Any] = mapped_column(JSONB, nullable=False)
+    form_completed: Mapped[bool | None] = mapped_column(default=False)  # Flag to indicate if the profile form is completed
+
+    __table_args__ = (
+        Index('idx_company_profiles_value_gin', 'value', postgresql_using='gin', postgresql_ops={'value': 'jsonb_path_ops'}),
+    )
 
 """
 CompanyRelationshipReference table stores references to relationships in the main database.
 Used for fast lookups of relationships relevant to this company.
 """
-class CompanyRelationshipReference(Base):
+class CompanyRelationshipReference(TimestampMixin, Base):
     __tablename__ = 'relationship_references'
-    id = Column(Integer, primary_key=True)
-    relationship_id = Column(Integer, nullable=False)  # ID of relationship in main DB
-    related_company_id = Column(Integer, nullable=False)  # ID of the other company in the relationship
-    is_source = Column(Boolean, nullable=False)  # True if this company initiated the relationship
-    type = Column(String(50), nullable=False)  # e.g., 'vendor', 'procurer', 'subsidiary'
-    status = Column(String(20), nullable=False)  # pending, active, rejected, inactive
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    id: Mapped[int] = mapped_column(primary_key=True)
+    relationship_id: Mapped[int] = mapped_column()  # ID of relationship in main DB
+    related_company_id: Mapped[int] = mapped_column()  # ID of the other company in the relationship
+    is_source: Mapped[bool] = mapped_column()  # True if this company initiated the relationship
+    type: Mapped[str] = mapped_column(CITEXT)  # e.g., 'vendor', 'procurer', 'subsidiary'
+    status: Mapped[str] = mapped_column(Enum('pending', 'active', 'rejected', 'inactive', name='relationship_reference_status'))
 
 """
 Legacy company relationship table - kept for backward compatibility.
 """
-class CompanyRelationship(Base):
+class CompanyRelationship(TimestampMixin, Base):
     __tablename__ = 'vendor_procurer_relations'
-    id = Column(Integer, primary_key=True)
-    company_id = Column(Integer, nullable=False)  # For storing string representation of company ID
-    status = Column(String(20), nullable=False, default='active')  # active, inactive, pending
-    data = Column(JSON, nullable=True)  # Additional relationship data
-    type = Column(String(50), nullable=False)  # e.g., 'vendor', 'procurer', 'subsidiary'
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    id: Mapped[int] = mapped_column(primary_key=True)
+    company_id: Mapped[int] = mapped_column()  # For storing string representation of company ID
+    status: Mapped[str] = mapped_column(Enum('active', 'inactive', 'pending', name='relationship_status'), default='active')
+    data: Mapped[Any] = mapped_column(JSONB, nullable=True)  # Additional relationship data
+    type: Mapped[str] = mapped_column(CITEXT)  # e.g., 'vendor', 'procurer', 'subsidiary'
+
+    __table_args__ = (
+        Index('idx_vendor_procurer_relations_data_gin', 'data', postgresql_using='gin', postgresql_ops={'data': 'jsonb_path_ops'}),
+    )
+
+
+_PO_COLS = (
+    "id", "date", "vendor_name", "vendor_number", "vendor_id", "contact_number",
+    "purchase_order_number", "material_number", "material_description", "order_quantity",
+    "unit_of_measure", "net_price", "total_spend", "purchasing_division_cost_center",
+    "cost_center_id", "region", "plant",
+    # New fields
+    "industry", "status", "business_unit", "physical_address_province", "bbbee_level",
+    "black_youth_ownership_percentage", "black_ownership_percentage", "women_ownership_percentage",
+    "category", "expiry_date", "company_size", "payment_terms",
+    # Additional spend analysis columns
+    "all_spend", "black_owned_spend", "black_woman_owned_spend", "qse_spend", "eme_spend",
+    "pp_spend", "multiplier",
+    # Metadata
+    "created_at", "updated_at",
+)
+# (key, isoformat) pairs: date/datetime values are rendered with isoformat()
+_PO_FIELDS = tuple((c, c in ("date", "expiry_date", "created_at", "updated_at")) for c in _PO_COLS)
+
+
+def _po_row_to_dict(row):
+    """Build the PurchaseOrder API dictionary from values ordered like _PO_COLS."""
+    return {
+        key: value.isoformat() if isoformat and value is not None else value
+        for (key, isoformat), value in zip(_PO_FIELDS, row)
+    }
 
 """
 PurchaseOrder table stores purchase order data for each company.
 """
-class PurchaseOrder(Base):
+class PurchaseOrder(TimestampMixin, Base):
     __tablename__ = 'purchase_orders'
-    id = Column(Integer, primary_key=True)
-    
+    # Columns are declared widest-alignment first (8-byte, then 4-byte, then
+    # variable-length) so heap tuples carry no alignment padding; TimestampMixin's
+    # 8-byte columns sort ahead of id/vendor_id, which together fill 8 bytes before
+    # the floats. Text columns skip VARCHAR's per-row length check.
+    # API key order comes from _PO_COLS.
+    id: Mapped[int] = mapped_column(primary_key=True)
+    vendor_id: Mapped[int] = mapped_column(default=0)  # ID of the matched vendor company
+
+    # 8-byte aligned
+    order_quantity: Mapped[float] = mapped_column(Float)
+    black_youth_ownership_percentage: Mapped[float] = mapped_column(Float)
+    black_ownership_percentage: Mapped[float] = mapped_column(Float)
+    women_ownership_percentage: Mapped[float] = mapped_column(Float)
+    multiplier: Mapped[float] = mapped_column(Float, default=1.0)
+
+    # 4-byte aligned
+    date: Mapped[dt.date] = mapped_column()
+    expiry_date: Mapped[dt.date] = mapped_column()
+
+    # Money
+    net_price: Mapped[Decimal] = mapped_column(Numeric(precision=15, scale=2))
+    # Derived spend is computed by Postgres on INSERT/UPDATE; never assign these.
+    # A generated column can't reference another one, so both use base columns.
+    total_spend: Mapped[Decimal] = mapped_column(
+        Numeric(precision=15, scale=2),
+        Computed('(order_quantity * net_price)::numeric(15,2)', persisted=True),
+    )
+    all_spend: Mapped[Decimal] = mapped_column(Numeric(precision=15, scale=2), default=0)
+    black_owned_spend: Mapped[Decimal] = mapped_column(
+        Numeric(precision=15, scale=2),
+        Computed('(order_quantity * net_price * black_ownership_percentage / 100.0)::numeric(15,2)', persisted=True),
+    )
+    black_woman_owned_spend: Mapped[Decimal] = mapped_column(Numeric(precision=15, scale=2), default=0)
+    qse_spend: Mapped[Decimal] = mapped_column(Numeric(precision=15, scale=2), default=0)
+    eme_spend: Mapped[Decimal] = mapped_column(Numeric(precision=15, scale=2), default=0)
+    pp_spend: Mapped[Decimal] = mapped_column(Numeric(precision=15, scale=2), default=0)
+
     # Purchase order details
-    date = Column(Date, nullable=False)
-    vendor_name = Column(String(255), nullable=False)
-    vendor_number = Column(String(50), nullable=False)
-    vendor_id = Column(Integer, nullable=False, default=0)  # ID of the matched vendor company
-    contact_number = Column(String(50), nullable=False)
-    purchase_order_number = Column(String(50), nullable=False)
-    material_number = Column(String(50), nullable=False)
-    material_description = Column(String(255), nullable=False)
-    order_quantity = Column(Float, nullable=False)
-    unit_of_measure = Column(String(50), nullable=False)
-    net_price = Column(Float, nullable=False)
-    total_spend = Column(Float, nullable=False)
-    purchasing_division_cost_center = Column(String(100), nullable=False)
-    cost_center_id = Column(String(50), nullable=False)
-    region = Column(String(50), nullable=False)
-    plant = Column(String(50), nullable=False)
-    
-    # New columns
-    industry = Column(String(100), nullable=False)
-    status = Column(String(50), nullable=False)
-    business_unit = Column(String(100), nullable=False)
-    physical_address_province = Column(String(100), nullable=False)
-    bbbee_level = Column(String(20), nullable=False)
-    black_youth_ownership_percentage = Column(Float, nullable=False)
-    black_ownership_percentage = Column(Float, nullable=False)
-    women_ownership_percentage = Column(Float, nullable=False)
-    category = Column(String(100), nullable=False)
-    expiry_date = Column(Date, nullable=False)
-    company_size = Column(String(50), nullable=False)
-    payment_terms = Column(String(100), nullable=False)
-    
-    # Additional spend analysis columns
-    all_spend = Column(Float, nullable=False, default=0.0)
-    black_owned_spend = Column(Float, nullable=False, default=0.0)
-    black_woman_owned_spend = Column(Float, nullable=False, default=0.0)
-    qse_spend = Column(Float, nullable=False, default=0.0)
-    eme_spend = Column(Float, nullable=False, default=0.0)
-    pp_spend = Column(Float, nullable=False, default=0.0)
-    multiplier = Column(Float, nullable=False, default=1.0)
-    
-    # Metadata
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    vendor_number: Mapped[str] = mapped_column(Text)
+    contact_number: Mapped[str] = mapped_column(Text)
+    purchase_order_number: Mapped[str] = mapped_column(Text)
+    material_number: Mapped[str] = mapped_column(Text)
+    unit_of_measure: Mapped[str] = mapped_column(Text)
+    purchasing_division_cost_center: Mapped[str] = mapped_column(Text)
+    cost_center_id: Mapped[str] = mapped_column(Text)
+    region: Mapped[str] = mapped_column(Text)
+    plant: Mapped[str] = mapped_column(Text)
+    industry: Mapped[str] = mapped_column(Text)
+    status: Mapped[str] = mapped_column(Text)
+    business_unit: Mapped[str] = mapped_column(Text)
+    physical_address_province: Mapped[str] = mapped_column(Text)
+    bbbee_level: Mapped[str] = mapped_column(Text)
+    category: Mapped[str] = mapped_column(Text)
+    company_size: Mapped[str] = mapped_column(Text)
+    payment_terms: Mapped[str] = mapped_column(Text)
+    vendor_name: Mapped[str] = mapped_column(Text)
+    material_description: Mapped[str] = mapped_column(Text)
+
+    # Purchase orders are appended roughly in date order, so a BRIN index covers
+    # date range scans at a fraction of a btree's size
+    __table_args__ = (
+        Index('idx_po_date_brin', 'date', postgresql_using='brin'),
+    )
     
+    @classmethod
+    def select_rows(cls):
+        """
+        Select the serialized columns as plain rows, skipping full entity hydration.
+        Pair with rows_to_dicts: PurchaseOrder.rows_to_dicts(session.execute(PurchaseOrder.select_rows()))
+        """
+        return select(*[getattr(cls, c) for c in _PO_COLS])
+
+    @staticmethod
+    def rows_to_dicts(rows):
+        """
+        Convert rows produced by select_rows() to dictionaries for API responses
+        """
+        return [_po_row_to_dict(row) for row in rows]
+
     def to_dict(self):
         """
         Convert the model to a dictionary for API responses
         """
-        return {
-            "id": self.id,
-            "date": str(self.date) if hasattr(self, 'date') else None,
-            "vendor_name": self.vendor_name,
-            "vendor_number": self.vendor_number,
-            "vendor_id": self.vendor_id,
-            "contact_number": self.contact_number,
-            "purchase_order_number": self.purchase_order_number,
-            "material_number": self.material_number,
-            "material_description": self.material_description,
-            "order_quantity": self.order_quantity,
-            "unit_of_measure": self.unit_of_measure,
-            "net_price": self.net_price,
-            "total_spend": self.total_spend,
-            "purchasing_division_cost_center": self.purchasing_division_cost_center,
-            "cost_center_id": self.cost_center_id,
-            "region": self.region,
-            "plant": self.plant,
-            # New fields
-            "industry": self.industry,
-            "status": self.status,
-            "business_unit": self.business_unit,
-            "physical_address_province": self.physical_address_province,
-            "bbbee_level": self.bbbee_level,
-            "black_youth_ownership_percentage": self.black_youth_ownership_percentage,
-            "black_ownership_percentage": self.black_ownership_percentage,
-            "women_ownership_percentage": self.women_ownership_percentage,
-            "category": self.category,
-            "expiry_date": str(self.expiry_date) if hasattr(self, 'expiry_date') else None,
-            "company_size": self.company_size,
-            "payment_terms": self.payment_terms,
-            # Additional spend analysis columns
-            "all_spend": self.all_spend,
-            "black_owned_spend": self.black_owned_spend,
-            "black_woman_owned_spend": self.black_woman_owned_spend,
-            "qse_spend": self.qse_spend,
-            "eme_spend": self.eme_spend,
-            "pp_spend": self.pp_spend,
-            "multiplier": self.multiplier,
-            # Metadata
-            "created_at": str(self.created_at) if hasattr(self, 'created_at') else None,
-            "updated_at": str(self.updated_at) if hasattr(self, 'updated_at') else None
-        }
-    
-class Tags(Base):
+        # Read loaded values straight from the instance dict; only unloaded/expired
+        # attributes go through the descriptor (which triggers the lazy load).
+        state = self.__dict__
+        return _po_row_to_dict([state[c] if c in state else getattr(self, c) for c in _PO_COLS])
+
+class Tags(TimestampMixin, Base):
     __tablename__ = 'tags'
-    id = Column(Integer, primary_key=True)
-    name = Column(String(50), nullable=False)
-    company_id = Column(Integer, nullable=False)
-    type = Column(String(20), nullable=False)  # e.g., company_name, custom, etc.
-    reference_id = Column(Integer, nullable=True)  # Optional reference to another entity (e.g. relationship id)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(String(50))
+    company_id: Mapped[int] = mapped_column()
+    type: Mapped[str] = mapped_column(CITEXT)  # e.g., company_name, custom, etc. (case-insensitive)
+    reference_id: Mapped[int | None] = mapped_column()  # Optional reference to another entity (e.g. relationship id)
     
     def to_dict(self):
         """
@@ -188,62 +305,63 @@ class Tags(Base):
             "company_id": self.company_id,
             "type": self.type,
             "reference_id": self.reference_id,
-            "created_at": str(self.created_at) if hasattr(self, 'created_at') else None,
-            "updated_at": str(self.updated_at) if hasattr(self, 'updated_at') else None
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None
         }
 
-class Category(Base):
+class Category(CachedLookupMixin, TimestampMixin, Base):
     __tablename__ = 'categories'
-    id = Column(Integer, primary_key=True)
-    category_number = Column(String(50), nullable=False, unique=True)
-    category_description = Column(String(255), nullable=False)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    id: Mapped[int] = mapped_column(primary_key=True)
+    category_number: Mapped[str] = mapped_column(String(50), unique=True)
+    category_description: Mapped[str] = mapped_column(String(255))
     
     # Relationship to commodities
-    commodities = relationship("Commodity", back_populates="category", cascade="all, delete-orphan")
+    commodities = relationship("Commodity", back_populates="category", cascade="all, delete-orphan",
+                               lazy="selectin", passive_deletes=True)
 
-class Commodity(Base):
+class Commodity(CachedLookupMixin, TimestampMixin, Base):
     __tablename__ = 'commodities'
-    id = Column(Integer, primary_key=True)
-    commodity_number = Column(String(50), nullable=False, unique=True)
-    commodity_description = Column(String(255), nullable=False)
-    category_id = Column(Integer, ForeignKey('categories.id', ondelete='CASCADE'), nullable=False)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    id: Mapped[int] = mapped_column(primary_key=True)
+    commodity_number: Mapped[str] = mapped_column(String(50), unique=True)
+    commodity_description: Mapped[str] = mapped_column(String(255))
+    category_id: Mapped[int] = mapped_column(ForeignKey('categories.id', ondelete='CASCADE'))
+
+    __table_args__ = (
+        Index('idx_commodities_category', 'category_id'),
+    )
     
     # Relationships
     category = relationship("Category", back_populates="commodities")
-    product_services = relationship("ProductService", back_populates="commodity", cascade="all, delete-orphan")
+    product_services = relationship("ProductService", back_populates="commodity", cascade="all, delete-orphan",
+                                    lazy="selectin", passive_deletes=True)
 
-class ProductService(Base):
+class ProductService(CachedLookupMixin, TimestampMixin, Base):
     __tablename__ = 'product_services'
-    id = Column(Integer, primary_key=True)
-    product_services_number = Column(String(50), nullable=False, unique=True)
-    product_services_description = Column(String(255), nullable=False)
-    commodity_id = Column(Integer, ForeignKey('commodities.id', ondelete='CASCADE'), nullable=False)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    id: Mapped[int] = mapped_column(primary_key=True)
+    product_services_number: Mapped[str] = mapped_column(String(50), unique=True)
+    product_services_description: Mapped[str] = mapped_column(String(255))
+    commodity_id: Mapped[int] = mapped_column(ForeignKey('commodities.id', ondelete='CASCADE'))
+
+    __table_args__ = (
+        Index('idx_product_services_commodity', 'commodity_id'),
+    )
     
     # Relationships
     commodity = relationship("Commodity", back_populates="product_services")
 
-class RequisitionType(Base):
+class RequisitionType(CachedLookupMixin, TimestampMixin, Base):
     __tablename__ = 'requisition_types'
-    id = Column(Integer, primary_key=True)
-    name = Column(String(100), nullable=False)
-    description = Column(String(255), nullable=True)
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(String(100))
+    description: Mapped[str | None] = mapped_column(String(255))
     
     # Hierarchical structure
-    parent_id = Column(Integer, ForeignKey('requisition_types.id'), nullable=True)
-    is_parent = Column(Boolean, nullable=False, default=False, server_default='false')  # True for RFQ/RFP/RFI, False for sub-types
+    parent_id: Mapped[int | None] = mapped_column(ForeignKey('requisition_types.id'))
+    is_parent: Mapped[bool] = mapped_column(default=False, server_default='false')  # True for RFQ/RFP/RFI, False for sub-types
     
     # Budget fields (only for sub-types of RFQ/RFP)
-    min_budget = Column(Numeric(15, 2), nullable=True)  # Only for sub-types
-    max_budget = Column(Numeric(15, 2), nullable=True)  # Only for sub-types
-    
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    min_budget: Mapped[Decimal | None] = mapped_column(BudgetAmount)  # Only for sub-types
+    max_budget: Mapped[Decimal | None] = mapped_column(BudgetAmount)  # Only for sub-types
     
     # Constraints
     __table_args__ = (
@@ -252,15 +370,24 @@ class RequisitionType(Base):
             "(is_parent = false AND parent_id IS NOT NULL AND min_budget IS NOT NULL AND max_budget IS NOT NULL)",
             name='valid_hierarchy_structure'
         ),
-        CheckConstraint('min_budget IS NULL OR min_budget >= 0', name='min_budget_non_negative'),
         CheckConstraint('max_budget IS NULL OR max_budget > min_budget', name='max_greater_than_min'),
         Index('idx_requisition_types_parent', 'parent_id'),
-        Index('idx_requisition_types_is_parent', 'is_parent'),
+        # Partial indexes instead of a low-cardinality btree on is_parent
+        Index('idx_reqtype_parents', 'id', postgresql_where=text('is_parent = true')),
+        Index('idx_reqtype_subtypes', 'parent_id', postgresql_where=text('is_parent = false')),
     )
     
-    # Relationships
+    # Relationships (children keeps lazy="select"; use selectin only for depth-first tree walks)
     parent = relationship('RequisitionType', remote_side=[id], backref='children')
     
+    @classmethod
+    def get_tree_cached(cls, session):
+        """
+        Whole type hierarchy as {id: node}, built once per cache fill so walks don't hit the DB.
+        Nodes are the cached row dicts plus a 'children' list of child nodes.
+        """
+        return _requisition_type_tree(cls, session)
+
     def to_dict(self):
         """Convert requisition type to dictionary."""
         return {
@@ -275,15 +402,21 @@ class RequisitionType(Base):
             'updated_at': self.updated_at.isoformat() if self.updated_at else None
         }
 
-class Department(Base):
+@cached(ttl=300)
+def _requisition_type_tree(cls, session):
+    nodes = {id: {**row, 'children': []} for id, row in cls.get_all_cached(session).items()}
+    for node in nodes.values():
+        if node['parent_id'] in nodes:
+            nodes[node['parent_id']]['children'].append(node)
+    return nodes
+
+class Department(CachedLookupMixin, TimestampMixin, Base):
     __tablename__ = 'departments'
-    id = Column(Integer, primary_key=True)
-    name = Column(String(100), nullable=False, unique=True)
-    description = Column(String(255), nullable=True)
-    department_head = Column(Integer, nullable=True)  # User ID from main_db.users
-    workflow_id = Column(Integer, nullable=True)  # Default workflow ID from main_db.workflows
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(String(100), unique=True)
+    description: Mapped[str | None] = mapped_column(String(255))
+    department_head: Mapped[int | None] = mapped_column()  # User ID from main_db.users
+    workflow_id: Mapped[int | None] = mapped_column()  # Default workflow ID from main_db.workflows
     
     def to_dict(self):
         """Convert department to dictionary."""
@@ -297,18 +430,16 @@ class Department(Base):
             'updated_at': self.updated_at.isoformat() if self.updated_at else None
         }
 
-class BudgetRange(Base):
+class BudgetRange(CachedLookupMixin, TimestampMixin, Base):
     """
     Budget ranges per RFQ category (RFQ, RFP only - RFI does not require budgets).
     Each organization can have only ONE budget range per category.
     """
     __tablename__ = 'budget_ranges'
-    id = Column(Integer, primary_key=True)
-    category = Column(String(10), nullable=False)  # RFQ or RFP (RFI excluded)
-    min_amount = Column(Numeric(15, 2), nullable=False)
-    max_amount = Column(Numeric(15, 2), nullable=False)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    id: Mapped[int] = mapped_column(primary_key=True)
+    category: Mapped[str] = mapped_column(String(10))  # RFQ or RFP (RFI excluded)
+    min_amount: Mapped[Decimal] = mapped_column(Numeric(15, 2))
+    max_amount: Mapped[Decimal] = mapped_column(Numeric(15, 2))
     
     # Constraints
     __table_args__ = (
@@ -330,119 +461,132 @@ class BudgetRange(Base):
         }
 
 
-class Requisition(Base):
+class Requisition(TimestampMixin, Base):
     __tablename__ = 'requisitions'
-    id = Column(Integer, primary_key=True)
-    requisition_number = Column(String(10), nullable=False, unique=True)  # Format: REQ00000
-    title = Column(String(255), nullable=False)
-    description = Column(String(1000), nullable=False)
-    type_id = Column(Integer, ForeignKey('requisition_types.id'), nullable=False)  # Parent type (RFQ/RFP/RFI)
-    sub_type_id = Column(Integer, ForeignKey('requisition_types.id'), nullable=True)  # Sub-type (Travel, Catering, etc.)
-    budget = Column(Float, nullable=False)  # Total budget for all items
-    department_id = Column(Integer, ForeignKey('departments.id'), nullable=False)
-    closing_date = Column(DateTime(timezone=True), nullable=False)
-    created_by = Column(Integer, nullable=False)  # Admin user ID
-    status = Column(String(50), nullable=False, default='draft')  # draft, pending, approved, rejected
-    is_draft = Column(Boolean, nullable=False, default=True)  # True for drafts, False for submitted
-    is_deleted = Column(Boolean, nullable=False, default=False)  # For soft deletion
-    deleted_at = Column(DateTime(timezone=True), nullable=True)  # When the record was soft deleted
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    id: Mapped[int] = mapped_column(primary_key=True)
+    requisition_number: Mapped[str] = mapped_column(String(10), unique=True)  # Format: REQ00000
+    title: Mapped[str] = mapped_column(String(255))
+    description: Mapped[str] = mapped_column(String(1000))
+    type_id: Mapped[int] = mapped_column(ForeignKey('requisition_types.id'))  # Parent type (RFQ/RFP/RFI)
+    sub_type_id: Mapped[int | None] = mapped_column(ForeignKey('requisition_types.id'))  # Sub-type (Travel, Catering, etc.)
+    budget: Mapped[float] = mapped_column(Float)  # Total budget for all items
+    department_id: Mapped[int] = mapped_column(ForeignKey('departments.id'))
+    closing_date: Mapped[dt.datetime] = mapped_column(DateTime(timezone=True))
+    created_by: Mapped[int] = mapped_column()  # Admin user ID
+    status: Mapped[str] = mapped_column(Enum('draft', 'pending', 'approved', 'rejected', name='requisition_status'), default='draft')
+    is_draft: Mapped[bool] = mapped_column(default=True)  # True for drafts, False for submitted
+    is_deleted: Mapped[bool] = mapped_column(default=False)  # For soft deletion
+    deleted_at: Mapped[dt.datetime | None] = mapped_column(DateTime(timezone=True))  # When the record was soft deleted
     
     # Workflow related fields
-    workflow_id = Column(Integer, nullable=True)  # ID of the selected workflow
-    workflow_execution_id = Column(Integer, nullable=True)  # ID of the current workflow execution
+    workflow_id: Mapped[int | None] = mapped_column()  # ID of the selected workflow
+    workflow_execution_id: Mapped[int | None] = mapped_column()  # ID of the current workflow execution
     
     # Note: Type/sub-type combination validation is handled in the application layer
     # PostgreSQL doesn't support subqueries in CHECK constraints
 
+    # Postgres doesn't index foreign key columns automatically
+    __table_args__ = (
+        Index('idx_requisition_dept', 'department_id'),
+        Index('idx_requisition_type', 'type_id'),
+        Index('idx_requisition_subtype', 'sub_type_id'),
+        # Covering index so timeline/list views over live rows are index-only scans
+        Index('idx_requisition_timeline', 'department_id', 'status',
+              postgresql_include=['title', 'closing_date'],
+              postgresql_where=text('is_deleted = false')),
+    )
+
     # Relationships
     requisition_type = relationship("RequisitionType", foreign_keys=[type_id])
     requisition_sub_type = relationship("RequisitionType", foreign_keys=[sub_type_id])
     department = relationship("Department")
-    items = relationship("RequisitionItem", back_populates="requisition", cascade="all, delete-orphan")
+    items = relationship("RequisitionItem", back_populates="requisition", cascade="all, delete-orphan",
+                         lazy="selectin", passive_deletes=True)
 
-class RequisitionItem(Base):
+class RequisitionItem(TimestampMixin, Base):
     __tablename__ = 'requisition_items'
-    id = Column(Integer, primary_key=True)
-    requisition_id = Column(Integer, ForeignKey('requisitions.id', ondelete='CASCADE'), nullable=False)
-    product_name = Column(String(255), nullable=False)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    id: Mapped[int] = mapped_column(primary_key=True)
+    requisition_id: Mapped[int] = mapped_column(ForeignKey('requisitions.id', ondelete='CASCADE'))
+    product_name: Mapped[str] = mapped_column(String(255))
+
+    __table_args__ = (
+        Index('idx_requisition_items_req', 'requisition_id'),
+    )
 
     # Relationships
     requisition = relationship("Requisition", back_populates="items")
 
-class ReportingSystemPreference(Base):
+class ReportingSystemPreference(TimestampMixin, Base):
     __tablename__ = 'reporting_system_preferences'
-    id = Column(Integer, primary_key=True)
-    organization_id = Column(Integer, nullable=False, unique=True)
-    system = Column(String(50), nullable=False, server_default='STANDARD')
-    power_bi_url = Column(String(2048), nullable=True)  # URL to the Power BI dashboard
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    id: Mapped[int] = mapped_column(primary_key=True)
+    organization_id: Mapped[int] = mapped_column(unique=True)
+    system: Mapped[ReportingSystem] = mapped_column(Enum(ReportingSystem, name='reporting_system'), server_default='STANDARD')
+    power_bi_url: Mapped[str | None] = mapped_column(String(2048))  # URL to the Power BI dashboard
 
 class ReportingSystemAuditLog(Base):
     __tablename__ = 'reporting_system_audit_logs'
-    id = Column(Integer, primary_key=True)
-    organization_id = Column(Integer, nullable=False)
-    user_id = Column(Integer, nullable=False)
-    user_name = Column(String(200), nullable=False)
-    previous_system = Column(String(50), nullable=False)
-    new_system = Column(String(50), nullable=False)
-    timestamp = Column(DateTime(timezone=True), server_default=func.now())
-
-class Evaluation(Base):
+    id: Mapped[int] = mapped_column(primary_key=True)
+    organization_id: Mapped[int] = mapped_column()
+    user_id: Mapped[int] = mapped_column()
+    user_name: Mapped[str] = mapped_column(String(200))
+    previous_system: Mapped[str] = mapped_column(String(50))
+    new_system: Mapped[str] = mapped_column(String(50))
+    timestamp: Mapped[dt.datetime | None] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+class Evaluation(TimestampMixin, Base):
     """
     Evaluation table stores evaluation entries created from published sourcing entries.
     Each evaluation contains vendor applications that need to be evaluated by a procurement committee.
     """
     __tablename__ = 'evaluations'
-    id = Column(Integer, primary_key=True)
-    evaluation_number = Column(String(50), nullable=False, unique=True)  # Format: EVL000/SRC000/REQ00000
-    sourcing_id = Column(Integer, ForeignKey('sourcing.id'), nullable=False)
-    requisition_id = Column(Integer, ForeignKey('requisitions.id'), nullable=False)
-    status = Column(String(50), nullable=False, default='pending')  # pending, in_progress, completed
-    created_by = Column(Integer, nullable=False)  # User ID who created this (same as sourcing creator)
-    is_deleted = Column(Boolean, nullable=False, default=False)  # For soft deletion
-    deleted_at = Column(DateTime(timezone=True), nullable=True)  # When the record was soft deleted
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    id: Mapped[int] = mapped_column(primary_key=True)
+    evaluation_number: Mapped[str] = mapped_column(String(50), unique=True)  # Format: EVL000/SRC000/REQ00000
+    sourcing_id: Mapped[int] = mapped_column(ForeignKey('sourcing.id'))
+    requisition_id: Mapped[int] = mapped_column(ForeignKey('requisitions.id'))
+    status: Mapped[str] = mapped_column(Enum('pending', 'in_progress', 'completed', name='evaluation_status'), default='pending')
+    created_by: Mapped[int] = mapped_column()  # User ID who created this (same as sourcing creator)
+    is_deleted: Mapped[bool] = mapped_column(default=False)  # For soft deletion
+    deleted_at: Mapped[dt.datetime | None] = mapped_column(DateTime(timezone=True))  # When the record was soft deleted
     
     # Award related fields
-    awarded_at = Column(DateTime(timezone=True), nullable=True)  # When the tender was awarded
-    awarded_by = Column(Integer, nullable=True)  # User ID who awarded the tender
-    delivery_date = Column(DateTime(timezone=True), nullable=True)  # Expected delivery date
-    procurement_documents = Column(JSON, nullable=True)  # Array of procurement/audit documents
-    approval_documents = Column(JSON, nullable=True)  # Array of approval documents
+    awarded_at: Mapped[dt.datetime | None] = mapped_column(DateTime(timezone=True))  # When the tender was awarded
+    awarded_by: Mapped[int | None] = mapped_column()  # User ID who awarded the tender
+    delivery_date: Mapped[dt.datetime | None] = mapped_column(DateTime(timezone=True))  # Expected delivery date
+    procurement_documents: Mapped[Any] = mapped_column(JSONB, nullable=True)  # Array of procurement/audit documents
+    approval_documents: Mapped[Any] = mapped_column(JSONB, nullable=True)  # Array of approval documents
     
     # Relationships
     sourcing = relationship("Sourcing", backref="evaluations")
     requisition = relationship("Requisition", backref="evaluations")
-    vendor_evaluations = relationship("VendorEvaluation", back_populates="evaluation", cascade="all, delete-orphan")
+    vendor_evaluations = relationship("VendorEvaluation", back_populates="evaluation", cascade="all, delete-orphan",
+                                      lazy="selectin", passive_deletes=True)
     
-    # Ensure only one evaluation per sourcing entry
+    # Ensure only one live evaluation per sourcing entry; soft-deleted rows don't count
     __table_args__ = (
-        UniqueConstraint('sourcing_id', name='unique_sourcing_evaluation'),
+        Index('unique_sourcing_evaluation', 'sourcing_id', unique=True,
+              postgresql_where=text('is_deleted = false')),
+        Index('idx_evaluation_requisition', 'requisition_id'),
+        Index('idx_evaluations_procurement_documents_gin', 'procurement_documents',
+              postgresql_using='gin', postgresql_ops={'procurement_documents': 'jsonb_path_ops'}),
+        Index('idx_evaluations_approval_documents_gin', 'approval_documents',
+              postgresql_using='gin', postgresql_ops={'approval_documents': 'jsonb_path_ops'}),
     )
 
-class VendorEvaluation(Base):
+class VendorEvaluation(TimestampMixin, Base):
     """
     VendorEvaluation table stores evaluation details for each vendor application.
     Each committee member evaluates each vendor based on legislative compliance and technical criteria.
     """
     __tablename__ = 'vendor_evaluations'
-    id = Column(Integer, primary_key=True)
-    evaluation_id = Column(Integer, ForeignKey('evaluations.id', ondelete='CASCADE'), nullable=False)
-    application_id = Column(Integer, ForeignKey('sourcing_applications.id', ondelete='CASCADE'), nullable=False)
-    evaluator_id = Column(Integer, nullable=False)  # User ID of the committee member
-    legislative_compliant = Column(Boolean, nullable=True)  # Yes/No for legislative compliance
-    technical_score = Column(Float, nullable=True)  # Score given by the evaluator
-    comments = Column(String(1000), nullable=True)  # Comments from the evaluator
-    status = Column(String(50), nullable=False, default='pending')  # pending, in_progress, completed, awarded
-    is_awarded = Column(Boolean, nullable=False, default=False)  # Whether this vendor was awarded
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    id: Mapped[int] = mapped_column(primary_key=True)
+    evaluation_id: Mapped[int] = mapped_column(ForeignKey('evaluations.id', ondelete='CASCADE'))
+    application_id: Mapped[int] = mapped_column(ForeignKey('sourcing_applications.id', ondelete='CASCADE'))
+    evaluator_id: Mapped[int] = mapped_column()  # User ID of the committee member
+    legislative_compliant: Mapped[bool | None] = mapped_column()  # Yes/No for legislative compliance
+    technical_score: Mapped[float | None] = mapped_column(Float)  # Score given by the evaluator
+    comments: Mapped[str | None] = mapped_column(String(1000))  # Comments from the evaluator
+    status: Mapped[str] = mapped_column(Enum('pending', 'in_progress', 'completed', 'awarded', name='vendor_evaluation_status'), default='pending')
+    is_awarded: Mapped[bool] = mapped_column(default=False)  # Whether this vendor was awarded
     
     # Relationships
     evaluation = relationship("Evaluation", back_populates="vendor_evaluations")
@@ -451,55 +595,58 @@ class VendorEvaluation(Base):
     # Ensure one evaluation per vendor per evaluator
     __table_args__ = (
         UniqueConstraint('evaluation_id', 'application_id', 'evaluator_id', name='unique_vendor_evaluator'),
+        # evaluation_id lookups are served by the unique constraint's index
+        Index('idx_vendor_eval_app', 'application_id'),
+        Index('idx_vendor_eval_evaluator', 'evaluator_id'),
     )
 
 
-class Sourcing(Base):
+class Sourcing(TimestampMixin, Base):
     """
     Sourcing table stores sourcing entries created from approved requisitions.
     ProcurerAdmin can upload documents and submit for approval through workflow system.
     """
     __tablename__ = 'sourcing'
-    id = Column(Integer, primary_key=True)
-    sourcing_number = Column(String(50), nullable=False, unique=True)  # Format: SRC000/REQ00000
-    requisition_id = Column(Integer, ForeignKey('requisitions.id'), nullable=False)
-    document_path = Column(String(255), nullable=True)  # Path to uploaded PDF document
-    status = Column(String(50), nullable=False, default='pending')  # pending, approved, rejected, published
+    id: Mapped[int] = mapped_column(primary_key=True)
+    sourcing_number: Mapped[str] = mapped_column(String(50), unique=True)  # Format: SRC000/REQ00000
+    requisition_id: Mapped[int] = mapped_column(ForeignKey('requisitions.id'))
+    document_path: Mapped[str | None] = mapped_column(String(255))  # Path to uploaded PDF document
+    status: Mapped[str] = mapped_column(Enum('pending', 'approved', 'rejected', 'published', name='sourcing_status'), default='pending')
     
     # Workflow related fields
-    workflow_id = Column(Integer, nullable=True)  # ID of the selected workflow
-    workflow_execution_id = Column(Integer, nullable=True)  # ID of the current workflow execution
-    closing_date = Column(DateTime(timezone=True), nullable=False)  # Inherited from requisition
+    workflow_id: Mapped[int | None] = mapped_column()  # ID of the selected workflow
+    workflow_execution_id: Mapped[int | None] = mapped_column()  # ID of the current workflow execution
+    closing_date: Mapped[dt.datetime] = mapped_column(DateTime(timezone=True))  # Inherited from requisition
     
-    created_by = Column(Integer, nullable=False)  # User ID who created this (same as requisition creator)
-    is_deleted = Column(Boolean, nullable=False, default=False)  # For soft deletion
-    deleted_at = Column(DateTime(timezone=True), nullable=True)  # When the record was soft deleted
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    created_by: Mapped[int] = mapped_column()  # User ID who created this (same as requisition creator)
+    is_deleted: Mapped[bool] = mapped_column(default=False)  # For soft deletion
+    deleted_at: Mapped[dt.datetime | None] = mapped_column(DateTime(timezone=True))  # When the record was soft deleted
+
+    __table_args__ = (
+        Index('idx_sourcing_requisition', 'requisition_id'),
+    )
     
     # Relationships
     requisition = relationship("Requisition", backref="sourcing_entries")
-    applications = relationship("SourcingApplication", back_populates="sourcing", cascade="all, delete-orphan")
+    applications = relationship("SourcingApplication", back_populates="sourcing", cascade="all, delete-orphan",
+                                lazy="selectin", passive_deletes=True)
     # evaluations relationship is defined in the Evaluation model using backref
 
-class SourcingApplication(Base):
+class SourcingApplication(TimestampMixin, Base):
     """
     SourcingApplication table stores vendor applications for sourcing entries.
     Vendors can fill out the sourcing document and submit their applications.
     """
     __tablename__ = 'sourcing_applications'
-    id = Column(Integer, primary_key=True)
-    sourcing_id = Column(Integer, ForeignKey('sourcing.id', ondelete='CASCADE'), nullable=False)
-    vendor_id = Column(Integer, nullable=False)  # ID of the vendor in the main database
-    vendor_company_id = Column(Integer, nullable=True)  # Company ID of the vendor for cross-database reference
-    application_number = Column(String(50), nullable=False, unique=True)  # Format: APP000/SRC000
-    document_path = Column(String(255), nullable=True)  # Path to uploaded filled document
-    additional_documents = Column(JSON, nullable=True)  # Array of additional supporting documents
-    price = Column(Numeric(precision=15, scale=2), nullable=True)  # Price quote provided by the vendor
-    status = Column(String(50), nullable=False, default='submitted')  # Only 'submitted' status is used now
-    
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    id: Mapped[int] = mapped_column(primary_key=True)
+    sourcing_id: Mapped[int] = mapped_column(ForeignKey('sourcing.id', ondelete='CASCADE'))
+    vendor_id: Mapped[int] = mapped_column()  # ID of the vendor in the main database
+    vendor_company_id: Mapped[int | None] = mapped_column()  # Company ID of the vendor for cross-database reference
+    application_number: Mapped[str] = mapped_column(String(50), unique=True)  # Format: APP000/SRC000
+    document_path: Mapped[str | None] = mapped_column(String(255))  # Path to uploaded filled document
+    additional_documents: Mapped[Any] = mapped_column(JSONB, nullable=True)  # Array of additional supporting documents
+    price: Mapped[Decimal | None] = mapped_column(Numeric(precision=15, scale=2))  # Price quote provided by the vendor
+    status: Mapped[str] = mapped_column(String(50), default='submitted')  # Only 'submitted' status is used now
     
     # Relationships
     sourcing = relationship("Sourcing", back_populates="applications")
@@ -508,6 +655,8 @@ class SourcingApplication(Base):
     # Ensure vendor can only submit one application per sourcing
     __table_args__ = (
         UniqueConstraint('sourcing_id', 'vendor_id', name='unique_vendor_application'),
+        Index('idx_sourcing_applications_additional_documents_gin', 'additional_documents',
+              postgresql_using='gin', postgresql_ops={'additional_documents': 'jsonb_path_ops'}),
     )
 
 # ==============================================================================
@@ -521,24 +670,32 @@ class Order(PurchaseOrder):
     __tablename__ = 'orders'
     __mapper_args__ = {'polymorphic_identity': 'order'}
     
-    id = Column(Integer, ForeignKey('purchase_orders.id'), primary_key=True)
-    evaluation_id = Column(Integer, ForeignKey('evaluations.id'), nullable=True)
-    sourcing_application_id = Column(Integer, ForeignKey('sourcing_applications.id'), nullable=True)
-    requisition_id = Column(Integer, ForeignKey('requisitions.id'), nullable=True)
-    exempt_order_id = Column(Integer, ForeignKey('exempt_orders.id'), nullable=True)  # Link to exempt orders
-    order_type = Column(String(50), nullable=True)  # 'purchase_order', 'framework_order', 'contract', 'exempt_order'
+    id: Mapped[int] = mapped_column(ForeignKey('purchase_orders.id'), primary_key=True)
+    evaluation_id: Mapped[int | None] = mapped_column(ForeignKey('evaluations.id'))
+    sourcing_application_id: Mapped[int | None] = mapped_column(ForeignKey('sourcing_applications.id'))
+    requisition_id: Mapped[int | None] = mapped_column(ForeignKey('requisitions.id'))
+    exempt_order_id: Mapped[int | None] = mapped_column(ForeignKey('exempt_orders.id'))  # Link to exempt orders
+    order_type: Mapped[str | None] = mapped_column(String(50))  # 'purchase_order', 'framework_order', 'contract', 'exempt_order'
     
     # Value tracking
-    total_order_value = Column(Float, nullable=True)  # Set when order type is chosen
-    consumed_value = Column(Float, nullable=True, default=0.0)  # For framework orders
-    remaining_value = Column(Float, nullable=True)  # For framework orders
+    total_order_value: Mapped[float | None] = mapped_column(Float)  # Set when order type is chosen
+    consumed_value: Mapped[float | None] = mapped_column(Float, default=0.0)  # For framework orders
+    remaining_value: Mapped[float | None] = mapped_column(Float)  # For framework orders
     
     # Dates
-    start_date = Column(DateTime(timezone=True), nullable=True)
-    end_date = Column(DateTime(timezone=True), nullable=True)
+    start_date: Mapped[dt.datetime | None] = mapped_column(DateTime(timezone=True))
+    end_date: Mapped[dt.datetime | None] = mapped_column(DateTime(timezone=True))
 
     # Documents
-    documents = Column(JSON, nullable=True)  # Array of documents
+    documents: Mapped[Any] = mapped_column(JSONB, nullable=True)  # Array of documents
+
+    # Postgres doesn't index foreign key columns automatically
+    __table_args__ = (
+        Index('idx_orders_evaluation', 'evaluation_id'),
+        Index('idx_orders_sourcing_application', 'sourcing_application_id'),
+        Index('idx_orders_requisition', 'requisition_id'),
+        Index('idx_orders_exempt_order', 'exempt_order_id'),
+    )
 
     # Relationships
     evaluation = relationship("Evaluation", backref="orders")
@@ -548,53 +705,57 @@ class Order(PurchaseOrder):
     items = relationship("OrderItem", back_populates="order", cascade="all, delete-orphan")
     # invoices relationship is defined in Invoice model using backref
 
-class OrderItem(Base):
+class OrderItem(TimestampMixin, Base):
     """
     OrderItem table stores individual items within an order.
     """
     __tablename__ = 'order_items'
-    id = Column(Integer, primary_key=True)
-    order_id = Column(Integer, ForeignKey('orders.id', ondelete='CASCADE'), nullable=False)
-    item_number = Column(String(50), nullable=True)
-    uom = Column(String(50), nullable=True)  # Unit of Matter
-    material_number = Column(String(50), nullable=True)
-    order_quantity = Column(Float, nullable=True)
-    description = Column(String(1000), nullable=True)
-    price_per_unit = Column(Float, nullable=True)
-    delivery_date = Column(DateTime(timezone=True), nullable=True)
-    net_value = Column(Float, nullable=True)  # Calculated: order_quantity * price_per_unit
-    gross_value = Column(Float, nullable=True)  # Net value + taxes/additional charges
+    id: Mapped[int] = mapped_column(primary_key=True)
+    order_id: Mapped[int] = mapped_column(ForeignKey('orders.id', ondelete='CASCADE'))
+    item_number: Mapped[str | None] = mapped_column(String(50))
+    uom: Mapped[str | None] = mapped_column(String(50))  # Unit of Matter
+    material_number: Mapped[str | None] = mapped_column(String(50))
+    order_quantity: Mapped[float | None] = mapped_column(Float)
+    description: Mapped[str | None] = mapped_column(String(1000))
+    price_per_unit: Mapped[float | None] = mapped_column(Float)
+    delivery_date: Mapped[dt.datetime | None] = mapped_column(DateTime(timezone=True))
+    net_value: Mapped[float | None] = mapped_column(Float)  # Calculated: order_quantity * price_per_unit
+    gross_value: Mapped[float | None] = mapped_column(Float)  # Net value + taxes/additional charges
     
     # Value tracking
-    maximum_value = Column(Float, nullable=True)  # For framework orders: total allowed value
-    consumed_value = Column(Float, nullable=True, default=0.0)  # For framework orders: sum of releases
-    remaining_value = Column(Float, nullable=True)  # For framework orders: maximum_value - consumed_value
+    maximum_value: Mapped[float | None] = mapped_column(Float)  # For framework orders: total allowed value
+    consumed_value: Mapped[float | None] = mapped_column(Float, default=0.0)  # For framework orders: sum of releases
+    remaining_value: Mapped[float | None] = mapped_column(Float)  # For framework orders: maximum_value - consumed_value
     
     # Contract-specific fields
-    contract_id = Column(String(100), nullable=True)
-    contract_value = Column(Float, nullable=True)  # Total contract value
-    payment_schedule = Column(JSON, nullable=True)  # Milestone payments structure
-    scope_of_work = Column(String(2000), nullable=True)
-    delivery_closing_date = Column(DateTime(timezone=True), nullable=True)
+    contract_id: Mapped[str | None] = mapped_column(String(100))
+    contract_value: Mapped[float | None] = mapped_column(Float)  # Total contract value
+    payment_schedule: Mapped[Any] = mapped_column(JSONB, nullable=True)  # Milestone payments structure
+    scope_of_work: Mapped[str | None] = mapped_column(String(2000))
+    delivery_closing_date: Mapped[dt.datetime | None] = mapped_column(DateTime(timezone=True))
 
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    # Items are listed per order in item-number order; also serves order_id lookups
+    __table_args__ = (
+        Index('idx_order_items_order_item_number', 'order_id', 'item_number'),
+    )
 
     # Relationships
     order = relationship("Order", back_populates="items")
     releases = relationship("FrameworkOrderRelease", back_populates="order_item", cascade="all, delete-orphan")
 
-class FrameworkOrderRelease(Base):
+class FrameworkOrderRelease(TimestampMixin, Base):
     """
     FrameworkOrderRelease table tracks releases for framework order items.
     """
     __tablename__ = 'framework_order_releases'
-    id = Column(Integer, primary_key=True)
-    order_item_id = Column(Integer, ForeignKey('order_items.id', ondelete='CASCADE'), nullable=False)
-    release_quantity = Column(Float, nullable=False)
-    release_date = Column(DateTime(timezone=True), server_default=func.now())
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    id: Mapped[int] = mapped_column(primary_key=True)
+    order_item_id: Mapped[int] = mapped_column(ForeignKey('order_items.id', ondelete='CASCADE'))
+    release_quantity: Mapped[float] = mapped_column(Float)
+    release_date: Mapped[dt.datetime | None] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        Index('idx_framework_order_releases_order_item', 'order_item_id'),
+    )
 
     # Relationships
     order_item = relationship("OrderItem", back_populates="releases")
@@ -603,85 +764,89 @@ class FrameworkOrderRelease(Base):
 # Exempt Order Models
 # ==============================================================================
 
-class ExemptOrder(Base):
+class ExemptOrder(TimestampMixin, Base):
     """
     ExemptOrder table stores orders that bypass the normal requisition/sourcing/evaluation process.
     These are emergency or special circumstance orders that go directly to invoice management.
     """
     __tablename__ = 'exempt_orders'
-    id = Column(Integer, primary_key=True)
-    exempt_order_number = Column(String(50), nullable=False, unique=True)  # EXO-2025-001, EXO-2025-002...
+    id: Mapped[int] = mapped_column(primary_key=True)
+    exempt_order_number: Mapped[str] = mapped_column(String(50), unique=True)  # EXO-2025-001, EXO-2025-002...
     
     # Order details
-    order_value = Column(Numeric(precision=15, scale=2), nullable=False)
-    exemption_reason = Column(Text, nullable=False)
-    order_category = Column(String(100), nullable=False)  # Travel, Hotel, IT Services, etc.
+    order_value: Mapped[Decimal] = mapped_column(Numeric(precision=15, scale=2))
+    exemption_reason: Mapped[str] = mapped_column(Text)
+    order_category: Mapped[str] = mapped_column(String(100))  # Travel, Hotel, IT Services, etc.
     
     # Status tracking
-    status = Column(String(50), nullable=False, default='pending')  # pending, completed
+    status: Mapped[str] = mapped_column(Enum('pending', 'completed', name='exempt_order_status'), default='pending')
     
     # Multiple vendor awards (JSON array)
-    awarded_vendors = Column(JSON, nullable=False)  # [{"vendor_id": 123, "vendor_name": "ABC Corp", "vendor_company_id": 456}, ...]
+    awarded_vendors: Mapped[Any] = mapped_column(JSONB, nullable=False)  # [{"vendor_id": 123, "vendor_name": "ABC Corp", "vendor_company_id": 456}, ...]
     
     # Value tracking
-    total_invoiced_value = Column(Numeric(precision=15, scale=2), nullable=True, default=0.0)  # Sum of paid invoices
+    total_invoiced_value: Mapped[Decimal | None] = mapped_column(Numeric(precision=15, scale=2), default=0.0)  # Sum of paid invoices
     
     # Timestamps
-    created_by = Column(Integer, nullable=False)  # User ID who created
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    created_by: Mapped[int] = mapped_column()  # User ID who created
     
     # Relationships
     invoices = relationship("Invoice", back_populates="exempt_order")
 
+    # Vendor lookups: awarded_vendors @> '[{"vendor_id": 123}]'. Databases created before
+    # the column became JSONB still have it as json; the generated upgrade converts it
+    # before building this index, which jsonb_path_ops can't do on json.
+    __table_args__ = (
+        Index('idx_exempt_orders_awarded_vendors_gin', 'awarded_vendors',
+              postgresql_using='gin', postgresql_ops={'awarded_vendors': 'jsonb_path_ops'}),
+    )
+
 # ==============================================================================
 # Invoice Management Models
 # ==============================================================================
 
-class Invoice(Base):
+class Invoice(TimestampMixin, Base):
     """
     Invoice table stores vendor invoices submitted against orders/contracts or exempt orders.
     """
     __tablename__ = 'invoices'
-    id = Column(Integer, primary_key=True)
-    order_id = Column(Integer, ForeignKey('orders.id', ondelete='CASCADE'), nullable=True)
-    exempt_order_id = Column(Integer, ForeignKey('exempt_orders.id', ondelete='CASCADE'), nullable=True)
+    id: Mapped[int] = mapped_column(primary_key=True)
+    order_id: Mapped[int | None] = mapped_column(ForeignKey('orders.id', ondelete='CASCADE'))
+    exempt_order_id: Mapped[int | None] = mapped_column(ForeignKey('exempt_orders.id', ondelete='CASCADE'))
     
     # Invoice details
-    company_name = Column(String(255), nullable=True)
-    invoice_number = Column(String(100), nullable=False)
-    date = Column(Date, nullable=True)
-    due_date = Column(Date, nullable=True)
+    company_name: Mapped[str | None] = mapped_column(String(255))
+    invoice_number: Mapped[str] = mapped_column(String(100))
+    date: Mapped[dt.date | None] = mapped_column()
+    due_date: Mapped[dt.date | None] = mapped_column()
     
     # Pricing details
-    price_excluding_vat = Column(Numeric(precision=15, scale=2), nullable=True)
-    vat = Column(Numeric(precision=15, scale=2), nullable=True)
-    price_including_vat = Column(Numeric(precision=15, scale=2), nullable=True)
-    value = Column(Numeric(precision=15, scale=2), nullable=False)  # Total value (price including VAT)
-    quantity = Column(Float, nullable=True)
+    price_excluding_vat: Mapped[Decimal | None] = mapped_column(Numeric(precision=15, scale=2))
+    vat: Mapped[Decimal | None] = mapped_column(Numeric(precision=15, scale=2))
+    price_including_vat: Mapped[Decimal | None] = mapped_column(Numeric(precision=15, scale=2))
+    value: Mapped[Decimal] = mapped_column(Numeric(precision=15, scale=2))  # Total value (price including VAT)
+    quantity: Mapped[float | None] = mapped_column(Float)
     
-    status = Column(String(50), nullable=False, default='awaiting-payment')  # awaiting-payment, rejected, paid
+    status: Mapped[str] = mapped_column(Enum('awaiting-payment', 'rejected', 'paid', name='invoice_status'), default='awaiting-payment')
     
     # Document details
-    document_url = Column(String(500), nullable=True)
-    document_name = Column(String(255), nullable=True)
-    file_name = Column(String(255), nullable=True)
+    document_url: Mapped[str | None] = mapped_column(String(500))
+    document_name: Mapped[str | None] = mapped_column(String(255))
+    file_name: Mapped[str | None] = mapped_column(String(255))
     
     # Vendor bank details
-    account_name = Column(String(255), nullable=True)
-    account_number = Column(String(50), nullable=True)
-    bank_name = Column(String(255), nullable=True)
-    branch_code = Column(String(20), nullable=True)
-    account_type = Column(String(50), nullable=True)
+    account_name: Mapped[str | None] = mapped_column(String(255))
+    account_number: Mapped[str | None] = mapped_column(String(50))
+    bank_name: Mapped[str | None] = mapped_column(String(255))
+    branch_code: Mapped[str | None] = mapped_column(String(20))
+    account_type: Mapped[str | None] = mapped_column(String(50))
     
     # Vendor compliance details
-    csd_number = Column(String(50), nullable=True)
-    vat_number = Column(String(50), nullable=True)
+    csd_number: Mapped[str | None] = mapped_column(String(50))
+    vat_number: Mapped[str | None] = mapped_column(String(50))
     
     # Timestamps
-    uploaded_date = Column(DateTime(timezone=True), server_default=func.now())
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    uploaded_date: Mapped[dt.datetime | None] = mapped_column(DateTime(timezone=True), server_default=func.now())
     
     # Relationships
     order = relationship("Order", backref="invoices")
@@ -691,37 +856,75 @@ class Invoice(Base):
     # Ensure unique invoice number per order or exempt order
     __table_args__ = (
         UniqueConstraint('order_id', 'invoice_number', name='unique_invoice_per_order'),
+        # order_id alone is served by the unique constraint's index
+        Index('idx_invoices_order_status', 'order_id', 'status'),
+        Index('idx_invoices_exempt_order', 'exempt_order_id'),
     )
 
-class DeliveryNote(Base):
+class DeliveryNote(TimestampMixin, Base):
     """
     DeliveryNote table stores delivery notes uploaded by clients to verify invoice deliveries.
     """
     __tablename__ = 'delivery_notes'
-    id = Column(Integer, primary_key=True)
-    invoice_id = Column(Integer, ForeignKey('invoices.id', ondelete='CASCADE'), nullable=False)
+    id: Mapped[int] = mapped_column(primary_key=True)
+    invoice_id: Mapped[int] = mapped_column(ForeignKey('invoices.id', ondelete='CASCADE'))
     
     # Document details
-    document_url = Column(String(500), nullable=True)
-    document_name = Column(String(255), nullable=True)
-    file_name = Column(String(255), nullable=True)
+    document_url: Mapped[str | None] = mapped_column(String(500))
+    document_name: Mapped[str | None] = mapped_column(String(255))
+    file_name: Mapped[str | None] = mapped_column(String(255))
     
     # Upload details
-    uploaded_by = Column(Integer, nullable=False)  # User ID who uploaded
-    uploaded_date = Column(DateTime(timezone=True), server_default=func.now())
+    uploaded_by: Mapped[int] = mapped_column()  # User ID who uploaded
+    uploaded_date: Mapped[dt.datetime | None] = mapped_column(DateTime(timezone=True), server_default=func.now())
     
     # Approval/Rejection details
-    approval_reason = Column(Text, nullable=True)
-    approved_by = Column(Integer, nullable=True)  # User ID who approved
-    approved_date = Column(DateTime(timezone=True), nullable=True)
-    
-    rejection_reason = Column(Text, nullable=True)
-    rejected_by = Column(Integer, nullable=True)  # User ID who rejected
-    rejected_date = Column(DateTime(timezone=True), nullable=True)
+    approval_reason: Mapped[str | None] = mapped_column(Text)
+    approved_by: Mapped[int | None] = mapped_column()  # User ID who approved
+    approved_date: Mapped[dt.datetime | None] = mapped_column(DateTime(timezone=True))
     
-    # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    rejection_reason: Mapped[str | None] = mapped_column(Text)
+    rejected_by: Mapped[int | None] = mapped_column()  # User ID who rejected
+    rejected_date: Mapped[dt.datetime | None] = mapped_column(DateTime(timezone=True))
+
+    __table_args__ = (
+        Index('idx_delivery_notes_invoice', 'invoice_id'),
+    )
     
     # Relationships
     invoice = relationship("Invoice", back_populates="delivery_notes")
+
+# ==============================================================================
+# Reporting Views
+# ==============================================================================
+
+"""
+mv_order_financials materialized view rolls invoices up per order, so order lists and
+framework balance checks read one row instead of re-aggregating invoices each time.
+Rejected invoices don't count. Invoices are written too often for a refresh trigger, and
+nothing here refreshes the view automatically: generated upgrades include
+REFRESH ... CONCURRENTLY (which the unique index on order_id allows) only when
+REFRESH_MATERIALIZED_VIEWS is enabled, so run it on a schedule outside this service.
+"""
+mv_order_financials = Table(
+    'mv_order_financials', Base.metadata,
+    Column('order_id', Integer, primary_key=True),
+    Column('total_invoiced', Numeric(15, 2)),
+    Column('remaining_value', Numeric(15, 2)),
+    info={
+        "is_materialized": True,
+        "definition": """
+            SELECT o.id AS order_id,
+                   COALESCE(SUM(i.value) FILTER (WHERE i.status <> 'rejected'), 0)::numeric(15,2) AS total_invoiced,
+                   (o.total_order_value::numeric
+                    - COALESCE(SUM(i.value) FILTER (WHERE i.status <> 'rejected'), 0))::numeric(15,2) AS remaining_value
+            FROM orders o
+            LEFT JOIN invoices i ON i.order_id = o.id
+            GROUP BY o.id
+        """,
+    },
+)
+
+class OrderFinancials(Base):
+    """Read-only mapping over mv_order_financials."""
+    __table__ = mv_order_financials
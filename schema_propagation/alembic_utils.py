@@ -0,0 +1,85 @@
+"""Helpers for long-running Alembic data migrations.
+
+Usage inside a revision's ``upgrade()``::
+
+    from schema_propagation.alembic_utils import paginated
+
+    users = sa.table("users", sa.column("id"), sa.column("preferences"))
+    query = sa.select(users.c.id)
+    for rows in paginated(query, users.c.id, page_size=100):
+        op.get_bind().execute(
+            users.update().where(users.c.id.in_([r.id for r in rows])).values(preferences={})
+        )
+
+Pages are read and processed inside ``autocommit_block()``, so work done for
+completed pages stays committed if the migration fails part-way, and memory is
+bounded by ``page_size``.
+
+Backfills should write in batches rather than row by row: ``bulk_insert`` sends
+chunks of rows as one executemany each, and ``copy_from`` streams rows through
+Postgres ``COPY`` for the largest loads. Loops that must issue many small
+statements can run under ``pipelined()`` so psycopg sends them without waiting
+for each result::
+
+    with pipelined():
+        for user_id, prefs in changes:
+            op.execute(users.update().where(users.c.id == user_id).values(preferences=prefs))
+"""
+from collections.abc import Iterable, Iterator, Sequence
+from contextlib import contextmanager
+from itertools import islice
+
+from alembic import op
+import sqlalchemy as sa
+
+
+def paginated(query: sa.Select, key: sa.ColumnElement, page_size: int = 100) -> Iterator[list[sa.Row]]:
+    """
+    Yield the rows of ``query`` in pages of ``page_size`` with the connection in autocommit.
+    Pages are keyset-paginated on ``key`` (``WHERE key > last ORDER BY key LIMIT n``), so
+    each page is an index range scan however far in it is, and rewriting rows already
+    seen doesn't shift later pages. ``key`` must be unique, indexed and selected by
+    ``query``; any ORDER BY on ``query`` is replaced.
+    """
+    bind = op.get_bind()
+    paged = query.order_by(None).order_by(key).limit(page_size)
+    with op.get_context().autocommit_block():
+        rows = bind.execute(paged).all()
+        while rows:
+            yield rows
+            if len(rows) < page_size:
+                break
+            rows = bind.execute(paged.where(key > rows[-1]._mapping[key])).all()
+
+
+def bulk_insert(table: sa.Table, rows: Iterable[dict], chunk: int = 1000) -> int:
+    """Insert ``rows`` with ``op.bulk_insert`` in chunks of ``chunk`` rows. Returns the row count."""
+    rows = iter(rows)
+    total = 0
+    while batch := list(islice(rows, chunk)):
+        op.bulk_insert(table, batch)
+        total += len(batch)
+    return total
+
+
+def copy_from(table: sa.Table, rows: Iterable[Sequence], columns: Sequence[str] | None = None) -> None:
+    """
+    Load ``rows`` (tuples ordered like ``columns``, defaulting to all table columns)
+    with ``COPY ... FROM STDIN``. Online mode only, as COPY needs the raw driver cursor.
+    """
+    columns = list(columns or table.columns.keys())
+    preparer = op.get_bind().dialect.identifier_preparer
+    column_list = ", ".join(preparer.quote(c) for c in columns)
+
+    with op.get_bind().connection.cursor() as cursor:
+        with cursor.copy(f"COPY {preparer.format_table(table)} ({column_list}) FROM STDIN") as copy:
+            for row in rows:
+                copy.write_row(row)
+
+
+@contextmanager
+def pipelined(connection: sa.Connection | None = None) -> Iterator[None]:
+    """Run the enclosed statements in psycopg pipeline mode (one network flush instead of one per statement)."""
+    connection = connection or op.get_bind()
+    with connection.connection.driver_connection.pipeline():
+        yield
@@ -1,21 +1,56 @@
+import os
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
-from prometheus_client import make_asgi_app, Counter, Histogram, Gauge
+from prometheus_client import REGISTRY, CollectorRegistry, make_asgi_app, multiprocess, Counter, Histogram, Gauge
 
+from .propagator import close_pools
 from .routes import router
 
-app = FastAPI(title="Schema Propagation", version="1.0.0")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    await close_pools()
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        # Drop this worker's live gauge files so livesum stops counting it
+        multiprocess.mark_process_dead(os.getpid())
+
+
+app = FastAPI(title="Schema Propagation", version="1.0.0", lifespan=lifespan)
 app.include_router(router)
 
+
+def _metrics_registry() -> CollectorRegistry:
+    """
+    With several uvicorn workers each process has its own metric values, so a scrape
+    would only see whichever worker answered. When PROMETHEUS_MULTIPROC_DIR is set
+    (docker/entrypoint.sh sets and empties it before the workers start), metrics are
+    written to mmap'd files there and /metrics aggregates all workers' files.
+    """
+    if "PROMETHEUS_MULTIPROC_DIR" not in os.environ:
+        return REGISTRY
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return registry
+
+
 # Prometheus metrics
-metrics_app = make_asgi_app()
+metrics_app = make_asgi_app(registry=_metrics_registry())
 app.mount("/metrics", metrics_app)
 
 propagation_total = Counter("schema_propagation_total", "Total propagations", ["status", "schema_type"])
+# Doubling buckets from 1ms to ~8s: finer resolution below 100ms, where the SLO is
 propagation_duration = Histogram(
     "schema_propagation_duration_seconds", "Duration per database",
-    ["schema_type"], buckets=[0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0]
+    ["schema_type"], buckets=tuple(2 ** i / 1000 for i in range(14))
+)
+# livesum: the rate across workers that are still alive. A worker leaves the sum when
+# lifespan shutdown marks it dead (reloads included); a killed worker's value stays
+# until the entrypoint empties the directory on the next start.
+propagation_rate = Gauge(
+    "schema_propagation_rate_per_second", "Current propagation rate", multiprocess_mode="livesum"
 )
-propagation_rate = Gauge("schema_propagation_rate_per_second", "Current propagation rate")
 
 
 @app.get("/health")
@@ -0,0 +1,107 @@
+"""Process-local caching for small, read-mostly lookup tables."""
+import threading
+import time
+from functools import wraps
+from typing import Any, Callable
+
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+
+# Every @cached wrapper, so ORM writes can invalidate all entries for a class
+_cached_functions: list[Callable] = []
+
+
+def cached(ttl: float = 300):
+    """
+    Cache ``fn(owner, session, *key)`` per ``(owner, *key)`` for ``ttl`` seconds.
+    The session only serves misses and is never part of the key. Committed ORM
+    inserts, updates and deletes on a CachedLookupMixin class drop that class's entries.
+    """
+    def decorator(fn):
+        entries: dict[tuple, tuple[float, Any]] = {}
+        # Bumped per owner on invalidation, so a load that started before a commit
+        # doesn't store the values it read afterwards
+        generations: dict[Any, int] = {}
+        lock = threading.Lock()
+
+        @wraps(fn)
+        def wrapper(owner, session: Session, *key):
+            cache_key = (owner, *key)
+            now = time.monotonic()
+            with lock:
+                entry = entries.get(cache_key)
+                if entry is not None and entry[0] > now:
+                    return entry[1]
+                generation = generations.get(owner, 0)
+            value = fn(owner, session, *key)
+            with lock:
+                if generations.get(owner, 0) == generation:
+                    entries[cache_key] = (now + ttl, value)
+            return value
+
+        def invalidate(owner) -> None:
+            with lock:
+                generations[owner] = generations.get(owner, 0) + 1
+                for cache_key in [k for k in entries if k[0] is owner]:
+                    del entries[cache_key]
+
+        wrapper.invalidate = invalidate
+        _cached_functions.append(wrapper)
+        return wrapper
+    return decorator
+
+
+@cached(ttl=300)
+def _load_rows(cls, session: Session) -> dict[Any, dict]:
+    columns = [attr.key for attr in cls.__mapper__.column_attrs]
+    return {
+        obj.id: {key: getattr(obj, key) for key in columns}
+        for obj in session.scalars(select(cls))
+    }
+
+
+class CachedLookupMixin:
+    """
+    TTL-cached lookups for tiny tables that are effectively immutable per request.
+    Rows are cached as plain dicts of column values keyed by id, so they can be
+    shared across sessions. Bulk UPDATE/DELETE statements bypass ORM events and
+    writes from other processes aren't seen; both are bounded by the TTL.
+    """
+
+    @classmethod
+    def get_all_cached(cls, session: Session) -> dict[Any, dict]:
+        return _load_rows(cls, session)
+
+    @classmethod
+    def get_cached(cls, session: Session, id) -> dict | None:
+        return _load_rows(cls, session).get(id)
+
+
+# Classes written in a session's flushes, invalidated once the transaction commits:
+# invalidating at flush time would let readers re-cache the old committed rows, and
+# a rolled-back write would still empty the cache
+_DIRTY_KEY = "cached_lookup_dirty"
+
+
+def _collect_dirty(session: Session, flush_context) -> None:
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, CachedLookupMixin):
+            session.info.setdefault(_DIRTY_KEY, set()).update(
+                cls for cls in type(obj).__mro__ if issubclass(cls, CachedLookupMixin)
+            )
+
+
+def _invalidate_committed(session: Session) -> None:
+    for cls in session.info.pop(_DIRTY_KEY, ()):
+        for fn in _cached_functions:
+            fn.invalidate(cls)
+
+
+def _discard_dirty(session: Session, previous_transaction) -> None:
+    if previous_transaction.parent is None:  # the outermost transaction rolled back
+        session.info.pop(_DIRTY_KEY, None)
+
+
+event.listen(Session, "after_flush", _collect_dirty)
+event.listen(Session, "after_commit", _invalidate_committed)
+event.listen(Session, "after_soft_rollback", _discard_dirty)
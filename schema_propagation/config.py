@@ -1,5 +1,7 @@
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from functools import lru_cache
+from functools import cached_property, lru_cache
+from typing import Literal
+from urllib.parse import quote
 
 class Settings(BaseSettings):
     model_config = SettingsConfigDict(env_file=".env", extra="ignore")
@@ -10,24 +12,107 @@ class Settings(BaseSettings):
     db_name: str = "postgres"
     pgbouncer_host: str = "pgbouncer"
     pgbouncer_port: int = 6432
+    # pgbouncer 1.21+ with max_prepared_statements > 0 tracks protocol-level prepared
+    # statements in transaction mode, so clients can keep their statement caches
+    pgbouncer_prepared_statements: bool = False
     max_concurrent_connections: int = 100
+    # Tenant connection pools kept open between propagations (one per database)
+    tenant_pool_cache_size: int = 1000
     error_threshold_percent: float = 10.0
     max_retries: int = 3
+    # Deadline for one database (connect, check, apply and retries) before it counts as failed
+    per_db_timeout_seconds: float = 60.0
+    # Shared job state across API workers (redis://host:6379/0); in-process only when unset
+    redis_url: str | None = None
     alembic_config_path: str = "alembic.ini"
     sql_versions_dir: str = "sql_versions"
+    # Version checksum hash: "blake2b" or "sha256" (faster on CPUs with SHA extensions)
+    checksum_algorithm: Literal["blake2b", "sha256"] = "blake2b"
+    # Append REFRESH MATERIALIZED VIEW CONCURRENTLY for each view to model-generated upgrades
+    refresh_materialized_views: bool = False
 
-    @property
+    @cached_property
     def direct_dsn(self) -> str:
-        return f"postgresql://{self.db_username}:{self.db_password}@{self.db_endpoint}:{self.db_port}/{self.db_name}"
+        return f"{self.dsn_prefixes[False]}/{self.db_name}"
 
-    @property
+    @cached_property
+    def migration_dsn(self) -> str:
+        """SQLAlchemy URL for Alembic; psycopg 3 provides pipeline mode for data migrations."""
+        return f"postgresql+psycopg://{self.dsn_credentials}@{self.db_endpoint}:{self.db_port}/{self.db_name}"
+
+    @cached_property
     def pgbouncer_dsn(self) -> str:
-        return f"postgresql://{self.db_username}:{self.db_password}@{self.pgbouncer_host}:{self.pgbouncer_port}/{self.db_name}"
+        return f"{self.dsn_prefixes[True]}/{self.db_name}"
+
+    @cached_property
+    def dsn_credentials(self) -> str:
+        """user:password, percent-encoded once so characters like @ : / can't break URL parsing."""
+        return f"{quote(self.db_username, safe='')}:{quote(self.db_password, safe='')}"
+
+    @cached_property
+    def dsn_prefixes(self) -> dict[bool, str]:
+        """DSN up to the database name, keyed by use_pgbouncer. Settings are fixed once loaded."""
+        credentials = f"postgresql://{self.dsn_credentials}"
+        return {
+            True: f"{credentials}@{self.pgbouncer_host}:{self.pgbouncer_port}",
+            False: f"{credentials}@{self.db_endpoint}:{self.db_port}",
+        }
 
     def db_dsn(self, database: str, use_pgbouncer: bool = True) -> str:
-        host = self.pgbouncer_host if use_pgbouncer else self.db_endpoint
-        port = self.pgbouncer_port if use_pgbouncer else self.db_port
-        return f"postgresql://{self.db_username}:{self.db_password}@{host}:{port}/{database}"
+        # Called once per target database; only the suffix is formatted per call
+        return f"{self.dsn_prefixes[use_pgbouncer]}/{database}"
+
+    @cached_property
+    def app_dsn(self) -> str:
+        """
+        SQLAlchemy async URL through pgbouncer. Transaction pooling can hand each
+        transaction a different server connection, so unless pgbouncer tracks them
+        (pgbouncer_prepared_statements) named prepared statements must be off:
+        prepared_statement_cache_size=0 disables SQLAlchemy's cache.
+        """
+        return self.async_dsn(self.db_name)
+
+    def async_dsn(self, database: str, use_pgbouncer: bool = True) -> str:
+        """SQLAlchemy asyncpg URL for create_async_engine(); see app_dsn for the pgbouncer query string."""
+        dsn = self.db_dsn(database, use_pgbouncer).replace("postgresql://", "postgresql+asyncpg://", 1)
+        if use_pgbouncer and not self.pgbouncer_prepared_statements:
+            return f"{dsn}?prepared_statement_cache_size=0"
+        return dsn
+
+    def engine_kwargs(self, use_pgbouncer: bool = True) -> dict:
+        """
+        create_async_engine() options for async_dsn(). Size the pool so that
+        clients * queries_per_request <= pool_size; past that, requests queue
+        on checkout and throughput collapses. Overflow lets a fan-out burst reach
+        max_concurrent_connections; LIFO checkout reuses the most recent (warm)
+        connections so idle extras time out instead of all being kept open.
+        pgbouncer already health-checks server connections, so pre-ping would
+        only add a round trip per checkout; direct connections keep it.
+        """
+        pool_size = min(20, self.max_concurrent_connections)
+        kwargs = {
+            "pool_size": pool_size,
+            "max_overflow": self.max_concurrent_connections - pool_size,
+            "pool_use_lifo": True,
+            "pool_pre_ping": not use_pgbouncer,
+            "pool_recycle": 1800,
+        }
+        connect_args = self.connect_kwargs(use_pgbouncer)
+        if connect_args:
+            kwargs["connect_args"] = connect_args
+        return kwargs
+
+    def connect_kwargs(self, use_pgbouncer: bool = True) -> dict:
+        """
+        asyncpg.connect() options. asyncpg prepares and caches every query per connection
+        (so repeated statements skip parsing and planning), which pgbouncer transaction
+        pooling only supports when it tracks prepared statements itself.
+        No socket options are needed: asyncio and uvloop already set TCP_NODELAY on
+        every TCP connection, so small statements aren't held back by Nagle.
+        """
+        if use_pgbouncer and not self.pgbouncer_prepared_statements:
+            return {"statement_cache_size": 0}
+        return {}
 
 @lru_cache
 def get_settings() -> Settings:
@@ -1,13 +1,24 @@
+import copy
 import hashlib
+import itertools
 import json
-from datetime import datetime
-from io import StringIO
+import mmap
+import os
+import shutil
+import sys
+import sysconfig
+import time
+import weakref
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
+from types import ModuleType
 import importlib.util
 
-from alembic import command
 from alembic.config import Config
-from alembic.runtime.migration import MigrationContext
+from alembic.runtime.environment import EnvironmentContext
+from alembic.runtime.migration import MigrationContext, MigrationStep
 from alembic.script import ScriptDirectory
 import sqlalchemy as sa
 from sqlalchemy.schema import CreateTable, CreateIndex, CreateColumn
@@ -15,6 +26,115 @@ from sqlalchemy.dialects import postgresql
 
 from .config import get_settings
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json produces equivalent files
+    orjson = None
+
+def _dumps(obj, indent: bool = False) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, indent=2).encode()
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def _loads(data: bytes):
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+# Append-only summary of every version (one compact JSON object per line), so
+# listing doesn't open each version directory
+INDEX_FILE = "index.jsonl"
+# version_id of the newest models-generated version, for prune diffs
+MODELS_HEAD_FILE = "models_head"
+# Rendered models DDL, keyed on the models file (see _compiled_models)
+COMPILED_DIR = ".compiled"
+# Part of the compiled cache key; bump when _compile_models' output changes
+COMPILED_FORMAT = 4
+
+
+# Disambiguates versions generated within the same second: (second, next number).
+# Four digits keep IDs sorting in creation order, so a second gets at most 10000.
+_version_counter = (0, 0)
+_VERSIONS_PER_SECOND = 10_000
+
+
+def _new_version_dir(versions_dir: Path) -> tuple[str, Path, str]:
+    """
+    Create a new, empty version directory and return (version_id, path, created_at).
+    IDs are the UTC second plus a per-second counter; mkdir fails rather than reusing
+    a directory, so a collision with another worker just takes the next number. Once
+    a second's numbers run out, the next second is used.
+    """
+    global _version_counter
+    while True:
+        seconds = time.time_ns() // 1_000_000_000
+        last_second, number = _version_counter
+        if seconds != last_second:
+            number = 0
+        if number >= _VERSIONS_PER_SECOND:
+            time.sleep(1 - time.time() % 1)
+            continue
+        _version_counter = (seconds, number + 1)
+        stamp = time.strftime("%Y%m%d_%H%M%S", time.gmtime(seconds))
+        version_id = f"{stamp}_{number:04d}"
+        version_path = versions_dir / version_id
+        try:
+            version_path.mkdir()
+            break
+        except FileExistsError:
+            continue
+    created_at = datetime.fromtimestamp(seconds, timezone.utc).isoformat(timespec="seconds")
+    return version_id, version_path, created_at
+
+
+@lru_cache(maxsize=4)
+def _alembic_bits(path: str, mtime: float) -> tuple[Config, ScriptDirectory, float]:
+    """Parsed alembic.ini, its ScriptDirectory and the versions dir mtime at load time."""
+    config = Config(path)
+    script = ScriptDirectory.from_config(config)
+    return config, script, os.path.getmtime(script.versions)
+
+
+def _load_alembic(path: str) -> tuple[Config, ScriptDirectory]:
+    """
+    Cached Config/ScriptDirectory, so repeated calls skip re-parsing the ini and
+    re-importing every revision. Editing the ini changes the cache key; adding or
+    removing a revision file changes the versions dir mtime and forces a reload.
+    """
+    config, script, versions_mtime = _alembic_bits(path, os.path.getmtime(path))
+    if os.path.getmtime(script.versions) != versions_mtime:
+        _alembic_bits.cache_clear()
+        config, script, _ = _alembic_bits(path, os.path.getmtime(path))
+    return config, script
+
+
+def _run_offline(config: Config, script: ScriptDirectory, starting_rev: str | None, destination_rev: str) -> None:
+    """
+    What command.upgrade/downgrade(..., sql=True) do, but with the cached ScriptDirectory:
+    those commands build a new one per call and re-import every revision file. Downgrades
+    run from starting_rev down to destination_rev; without a starting_rev, it's an upgrade.
+    """
+    revision_map = script.revision_map
+
+    def upgrade_steps(rev, context) -> list:
+        revs = script.iterate_revisions(destination_rev, rev, implicit_base=True)
+        return [MigrationStep.upgrade_from_script(revision_map, s) for s in reversed(list(revs))]
+
+    def downgrade_steps(rev, context) -> list:
+        revs = script.iterate_revisions(rev, destination_rev, select_for_downgrade=True)
+        return [MigrationStep.downgrade_from_script(revision_map, s) for s in revs]
+
+    with EnvironmentContext(
+        config, script,
+        fn=downgrade_steps if starting_rev else upgrade_steps,
+        as_sql=True,
+        starting_rev=starting_rev,
+        destination_rev=destination_rev,
+    ):
+        script.run_env()
+
 
 def generate_sql(description: str, target_revision: str = "head") -> dict:
     """Extract SQL from Alembic migrations using offline mode."""
@@ -22,43 +142,38 @@ def generate_sql(description: str, target_revision: str = "head") -> dict:
     versions_dir = Path(settings.sql_versions_dir)
     versions_dir.mkdir(exist_ok=True)
 
-    config = Config(settings.alembic_config_path)
-    script = ScriptDirectory.from_config(config)
+    cached_config, script = _load_alembic(settings.alembic_config_path)
     head = script.get_current_head()
+    # output_buffer is set per call; don't leak it into the cached Config
+    config = copy.copy(cached_config)
 
-    # Capture SQL in offline mode
-    upgrade_sql = StringIO()
-    downgrade_sql = StringIO()
-
-    config.output_buffer = upgrade_sql
-    command.upgrade(config, target_revision, sql=True)
+    version_id, version_path, created_at = _new_version_dir(versions_dir)
 
-    config.output_buffer = downgrade_sql
-    from_rev = head or target_revision
-    command.downgrade(config, f"{from_rev}:base", sql=True)
+    # Alembic's offline output goes straight into the version files
+    try:
+        with open(version_path / "upgrade.sql", "w", encoding="utf-8") as upgrade_sql:
+            config.output_buffer = upgrade_sql
+            _run_offline(config, script, None, target_revision)
 
-    upgrade_content = upgrade_sql.getvalue()
-    downgrade_content = downgrade_sql.getvalue()
+        with open(version_path / "downgrade.sql", "w", encoding="utf-8") as downgrade_sql:
+            config.output_buffer = downgrade_sql
+            _run_offline(config, script, head or target_revision, "base")
+    except BaseException:
+        shutil.rmtree(version_path, ignore_errors=True)
+        raise
 
-    # Generate version metadata
-    version_id = datetime.now().strftime("%Y%m%d_%H%M%S")
-    checksum = hashlib.sha256(upgrade_content.encode()).hexdigest()[:16]
+    checksum = _file_checksum(version_path / "upgrade.sql", settings.checksum_algorithm)
 
-    version_path = versions_dir / version_id
-    version_path.mkdir(exist_ok=True)
-
-    # Write files
-    (version_path / "upgrade.sql").write_text(upgrade_content)
-    (version_path / "downgrade.sql").write_text(downgrade_content)
-    
     metadata = {
         "version_id": version_id,
         "revision_id": head,
         "checksum": checksum,
+        "checksum_algorithm": settings.checksum_algorithm,
         "description": description,
-        "created_at": datetime.now().isoformat()
+        "created_at": created_at
     }
-    (version_path / "metadata.json").write_text(json.dumps(metadata, indent=2))
+    _write_buffers(version_path / "metadata.json", [_dumps(metadata, indent=True)])
+    _record_version(versions_dir, metadata)
 
     return {
         "success": True,
@@ -79,69 +194,362 @@ def get_version(version_id: str) -> dict | None:
     if not version_path.exists():
         return None
     
-    metadata = json.loads((version_path / "metadata.json").read_text())
+    metadata = _loads((version_path / "metadata.json").read_bytes())
     metadata["upgrade_sql"] = (version_path / "upgrade.sql").read_text()
     return metadata
 
 
 def list_versions() -> list[dict]:
-    """List all generated SQL versions."""
+    """List all generated SQL versions, newest first (manifests are omitted)."""
     settings = get_settings()
     versions_dir = Path(settings.sql_versions_dir)
     
     if not versions_dir.exists():
         return []
-    
+
+    index_path = versions_dir / INDEX_FILE
+    if not index_path.exists():
+        _rebuild_index(versions_dir)
+
     versions = []
-    for path in sorted(versions_dir.iterdir(), reverse=True):
-        if (path / "metadata.json").exists():
-            versions.append(json.loads((path / "metadata.json").read_text()))
+    seen = set()
+    for line in _read_lines_reversed(index_path):
+        entry = _loads(line)
+        if entry["version_id"] not in seen:
+            seen.add(entry["version_id"])
+            versions.append(entry)
     return versions
 
 
+def _index_entry(metadata: dict) -> bytes:
+    entry = {key: value for key, value in metadata.items() if key != "manifest"}
+    return _dumps(entry) + b"\n"
+
+
+def _set_models_head(versions_dir: Path, version_id: str) -> None:
+    tmp_path = versions_dir / f"{MODELS_HEAD_FILE}.tmp"
+    tmp_path.write_text(version_id)
+    os.replace(tmp_path, versions_dir / MODELS_HEAD_FILE)
+
+
+def _rebuild_index(versions_dir: Path) -> None:
+    """Recreate the index and models head from the version directories (e.g. for older stores)."""
+    # scandir gives names and entry types without per-entry Path objects or stats
+    with os.scandir(versions_dir) as it:
+        entries = [entry for entry in it if entry.is_dir(follow_symlinks=False)]
+    entries.sort(key=lambda entry: entry.name)
+
+    lines = []
+    models_head = None
+    for entry in entries:
+        meta_path = os.path.join(entry.path, "metadata.json")
+        if os.path.isfile(meta_path):
+            with open(meta_path, "rb") as f:
+                metadata = _loads(f.read())
+            lines.append(_index_entry(metadata))
+            if metadata.get("revision_id") == "models" and "manifest" in metadata:
+                models_head = metadata["version_id"]
+
+    tmp_path = versions_dir / f"{INDEX_FILE}.tmp"
+    tmp_path.write_bytes(b"".join(lines))
+    os.replace(tmp_path, versions_dir / INDEX_FILE)
+    if models_head:
+        _set_models_head(versions_dir, models_head)
+
+
+def _record_version(versions_dir: Path, metadata: dict) -> None:
+    """Add a just-written version to the index; call after its metadata.json exists."""
+    index_path = versions_dir / INDEX_FILE
+    if not index_path.exists():
+        _rebuild_index(versions_dir)  # picks up this version too
+        return
+    with index_path.open("ab") as f:
+        f.write(_index_entry(metadata))
+    if metadata["revision_id"] == "models":
+        _set_models_head(versions_dir, metadata["version_id"])
+
+
+def _read_lines_reversed(path: Path, chunk_size: int = 64 * 1024):
+    """Yield the non-empty lines of path last to first, reading backwards in chunks."""
+    with path.open("rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        tail = b""
+        while pos > 0:
+            step = min(chunk_size, pos)
+            pos -= step
+            f.seek(pos)
+            lines = (f.read(step) + tail).split(b"\n")
+            tail = lines.pop(0)  # may be a partial line; completed by the next chunk
+            for line in reversed(lines):
+                if line:
+                    yield line
+        if tail:
+            yield tail
+
+
 def _load_previous_manifest(versions_dir: Path, specific_version: str | None = None) -> dict | None:
     """Load manifest from a previous models-generated version."""
-    candidates = []
-    if specific_version:
-        candidates.append(versions_dir / specific_version)
-    else:
-        candidates.extend(sorted(versions_dir.iterdir(), reverse=True) if versions_dir.exists() else [])
-
-    for candidate in candidates:
-        meta_path = candidate / "metadata.json"
-        if meta_path.exists():
-            data = json.loads(meta_path.read_text())
-            if data.get("revision_id") == "models" and "manifest" in data:
-                return data["manifest"]
+    if not versions_dir.exists():
+        return None
+
+    if not specific_version:
+        head_path = versions_dir / MODELS_HEAD_FILE
+        if not head_path.exists():
+            _rebuild_index(versions_dir)
+        if not head_path.exists():
+            return None
+        specific_version = head_path.read_text().strip()
+
+    meta_path = versions_dir / specific_version / "metadata.json"
+    if meta_path.exists():
+        data = _loads(meta_path.read_bytes())
+        if data.get("revision_id") == "models" and "manifest" in data:
+            return data["manifest"]
     return None
 
 
-def generate_sql_from_models(
-    path: str,
-    base_symbol: str = "Base",
-    description: str = "models import",
-    prune_missing: bool = False,
-    previous_version_id: str | None = None
-) -> dict:
+def _new_digest(algorithm: str):
     """
-    Dynamically load a SQLAlchemy model file and emit Postgres DDL as SQL.
-    No database connection is required.
-    If prune_missing is True, compare against the latest models manifest (or provided previous_version_id)
-    and emit DROP statements for removed tables/columns.
+    Hash object for version checksums (16 hex chars). blake2b is the default; sha256
+    (truncated) can be faster on CPUs with SHA extensions, where OpenSSL uses them.
     """
-    settings = get_settings()
-    versions_dir = Path(settings.sql_versions_dir)
-    versions_dir.mkdir(exist_ok=True)
+    if algorithm == "sha256":
+        return hashlib.sha256()
+    if algorithm == "blake2b":
+        return hashlib.blake2b(digest_size=8)
+    raise ValueError(f"Unsupported checksum algorithm: {algorithm}")
+
+
+def _write_parts(
+    path: Path,
+    parts: list[str],
+    algorithm: str,
+    sep: str = "\n\n",
+    end: str = "\n"
+) -> str:
+    """
+    Write sep.join(parts) + end to path without building the joined string: each
+    part is encoded and hashed once and the buffers go out in a single writev.
+    Returns the same checksum as hashing the joined content.
+    """
+    digest = _new_digest(algorithm)
+    sep_bytes = sep.encode()
+    buffers = []
+    for i, part in enumerate(parts):
+        if i:
+            buffers.append(sep_bytes)
+        buffers.append(part.encode())
+    buffers.append(end.encode())
+    for buf in buffers:
+        digest.update(buf)
+    _write_buffers(path, buffers)
+    return digest.hexdigest()[:16]
+
+
+def _file_checksum(path: Path, algorithm: str) -> str:
+    """Checksum of a file's bytes, hashed from an mmap rather than a copy in memory."""
+    digest = _new_digest(algorithm)
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size:  # mmap can't map an empty file
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                digest.update(mm)
+    return digest.hexdigest()[:16]
+
+
+def sql_checksum(sql: str) -> str:
+    """Checksum of SQL text held in memory, matching the checksums of version files."""
+    digest = _new_digest(get_settings().checksum_algorithm)
+    digest.update(sql.encode())
+    return digest.hexdigest()[:16]
+
+
+# writev accepts at most IOV_MAX buffers per call
+_IOV_MAX = os.sysconf("SC_IOV_MAX") if hasattr(os, "sysconf") and "SC_IOV_MAX" in os.sysconf_names else 1024
+
+
+def _write_buffers(path: Path, buffers: list[bytes]) -> None:
+    """Write buffers to path with as few syscalls as possible (os.writev where available)."""
+    with open(path, "wb", buffering=0) as f:
+        if not hasattr(os, "writev"):
+            for buf in buffers:
+                f.write(buf)
+            return
+        fd = f.fileno()
+        pending = [memoryview(buf) for buf in buffers if buf]
+        start = 0
+        while start < len(pending):
+            written = os.writev(fd, pending[start:start + _IOV_MAX])
+            # Skip fully written buffers and trim a partially written one
+            while written and written >= len(pending[start]):
+                written -= len(pending[start])
+                start += 1
+            if written:
+                pending[start] = pending[start][written:]
+
+
+def _compile_ddl(dialect: sa.Dialect, element) -> str:
+    """Render a DDL construct with the dialect's compiler directly (what .compile() does, minus the overhead)."""
+    return dialect.ddl_compiler(dialect, element).string.rstrip()
+
+
+def _sorted_indexes(table: sa.Table) -> list[sa.Index]:
+    # Table.indexes is a set; sort so the SQL (and its checksum) is stable across runs
+    return sorted(table.indexes, key=lambda idx: idx.name or "")
+
+
+@dataclass(frozen=True)
+class _SchemaTypes:
+    enums: dict[str, sa.Enum]
+    domains: dict[str, postgresql.DOMAIN]
+    uses_citext: bool
+
+
+_schema_types_cache: "weakref.WeakKeyDictionary[sa.MetaData, _SchemaTypes]" = weakref.WeakKeyDictionary()
+
+
+def _schema_types(metadata: sa.MetaData) -> _SchemaTypes:
+    """
+    Enum and domain types used by the regular (non-materialized) tables, scanned once
+    per MetaData in a single pass over all columns. Unnamed enums are given their
+    "{table}_{column}_enum" name here, before any DDL referencing them is rendered.
+    """
+    cached = _schema_types_cache.get(metadata)
+    if cached is not None:
+        return cached
+
+    enums: dict[str, sa.Enum] = {}
+    domains: dict[str, postgresql.DOMAIN] = {}
+    uses_citext = False
+    columns = (
+        (table, col)
+        for table in metadata.sorted_tables
+        if not table.info.get("is_materialized")
+        for col in table.columns
+    )
+    for table, col in columns:
+        col_type = col.type
+        if isinstance(col_type, sa.Enum):
+            if not col_type.name:
+                col_type.name = f"{table.name}_{col.name}_enum"
+            enums[col_type.name] = col_type
+        elif isinstance(col_type, postgresql.DOMAIN):
+            domains[col_type.name] = col_type
+        elif isinstance(col_type, postgresql.CITEXT):
+            uses_citext = True
+
+    cached = _schema_types_cache[metadata] = _SchemaTypes(enums, domains, uses_citext)
+    return cached
+
+
+@dataclass(frozen=True)
+class _TableDDL:
+    create_sql: list[str]  # CREATE TABLE, json -> jsonb conversions, then CREATE INDEX
+    add_column_sql: list[str]
+    column_names: list[str]  # for the manifest
+
+
+# Rendered DDL per Table object. Weak keys: entries are dropped together with the
+# model module that defined the table.
+_table_ddl_cache: "weakref.WeakKeyDictionary[sa.Table, _TableDDL]" = weakref.WeakKeyDictionary()
+
+
+def _table_ddl(table: sa.Table, dialect: sa.Dialect) -> _TableDDL:
+    """
+    DDL for a regular table, rendered once per Table object in a single pass over
+    its columns. Enum type names must already be assigned (see _schema_types),
+    since they are baked into the cached column definitions.
+    """
+    cached = _table_ddl_cache.get(table)
+    if cached is None:
+        table_ident = dialect.identifier_preparer.format_table(table)
+        add_column_sql = []
+        column_names = []
+        for col in table.columns:
+            add_column_sql.append(
+                f"ALTER TABLE {table_ident} ADD COLUMN IF NOT EXISTS {_compile_ddl(dialect, CreateColumn(col))};"
+            )
+            column_names.append(str(col.name))
+
+        create_sql = [_compile_ddl(dialect, CreateTable(table, if_not_exists=True)) + ";"]
+        create_sql.extend(
+            _jsonb_conversion(table_ident, col, dialect) for col in table.columns
+            if isinstance(col.type, postgresql.JSONB)
+        )
+        create_sql.extend(
+            _compile_ddl(dialect, CreateIndex(idx, if_not_exists=True)) + ";" for idx in _sorted_indexes(table)
+        )
+        cached = _table_ddl_cache[table] = _TableDDL(create_sql, add_column_sql, column_names)
+    return cached
+
+
+def _jsonb_conversion(table_ident: str, col: sa.Column, dialect: sa.Dialect) -> str:
+    """
+    Convert a column an existing database still has as json to jsonb. Runs before the
+    table's indexes, which (GIN with jsonb_path_ops) can't be built on json; a no-op
+    where the column is already jsonb or doesn't exist yet.
+    """
+    col_ident = dialect.identifier_preparer.quote(col.name)
+    table_literal = "'" + table_ident.replace("'", "''") + "'"
+    col_literal = "'" + col.name.replace("'", "''") + "'"
+    return (
+        "DO $$ BEGIN IF EXISTS (SELECT 1 FROM pg_attribute "
+        f"WHERE attrelid = {table_literal}::regclass AND attname = {col_literal} "
+        "AND atttypid = 'json'::regtype AND NOT attisdropped) THEN "
+        f"ALTER TABLE {table_ident} ALTER COLUMN {col_ident} TYPE jsonb USING {col_ident}::jsonb; "
+        "END IF; END $$;"
+    )
+
+
+def _materialized_view_ddl(table: sa.Table, dialect: sa.Dialect) -> list[str]:
+    """
+    DDL for a Table declared with info={"is_materialized": True, "definition": "SELECT ..."}.
+    Optional info["ddl"] statements (e.g. refresh triggers) are emitted after the view.
+    """
+    preparer = dialect.identifier_preparer
+    table_ident = preparer.format_table(table)
+    definition = table.info["definition"].strip().rstrip(";")
+    ddl = [f"CREATE MATERIALIZED VIEW IF NOT EXISTS {table_ident} AS {definition} WITH DATA;"]
+
+    # Views can't carry a primary key; a unique index on it keeps REFRESH ... CONCURRENTLY possible
+    pk_cols = [preparer.quote(c.name) for c in table.primary_key.columns]
+    if pk_cols:
+        pk_index = preparer.quote(f"{table.name}_pkey")
+        ddl.append(f"CREATE UNIQUE INDEX IF NOT EXISTS {pk_index} ON {table_ident} ({', '.join(pk_cols)});")
+    ddl.extend(_compile_ddl(dialect, CreateIndex(idx, if_not_exists=True)) + ";" for idx in _sorted_indexes(table))
+
+    ddl.extend(table.info.get("ddl", ()))
+    return ddl
 
-    module_path = Path(path)
-    if not module_path.exists():
-        raise FileNotFoundError(f"Model file not found: {module_path}")
+
+# abspath -> ((mtime, size), module); one entry per file so replaced modules
+# (and their cached table DDL) can be garbage collected
+_model_modules: dict[str, tuple[tuple[float, int], ModuleType]] = {}
+
+
+def _load_models_module(module_path: Path) -> ModuleType:
+    """Execute a models file once and reuse it until the file's mtime or size changes."""
+    st = module_path.stat()
+    key = str(module_path.resolve())
+    stamp = (st.st_mtime, st.st_size)
+    cached = _model_modules.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
 
     spec = importlib.util.spec_from_file_location("dynamic_models", module_path)
     if not spec or not spec.loader:
         raise ImportError(f"Unable to load module from {module_path}")
     module = importlib.util.module_from_spec(spec)
     spec.loader.exec_module(module)
+    _model_modules[key] = (stamp, module)
+    return module
+
+
+def _compile_models(module_path: Path, base_symbol: str) -> dict:
+    """
+    Render everything about a models file that doesn't depend on previous versions:
+    the DDL sections of the upgrade script (in order) and the table manifest.
+    """
+    module = _load_models_module(module_path)
 
     if not hasattr(module, base_symbol):
         raise ValueError(f"{base_symbol} not found in module {module_path}")
@@ -155,91 +563,214 @@ def generate_sql_from_models(
     dialect = postgresql.dialect()
     statements: list[str] = []
     alter_statements: list[str] = []
-    drop_statements: list[str] = []
-    enum_types: dict[str, sa.Enum] = {}
-    format_table = dialect.identifier_preparer.format_table
+    view_statements: list[str] = []
+    refresh_statements: list[str] = []
+    table_ddl: list[str] = list(metadata.info.get("ddl", ()))
+    # Enum/domain types are created before the tables that use them
+    schema_types = _schema_types(metadata)
 
     # Manifest for diffing and metadata
     manifest: dict[str, dict] = {"tables": {}}
 
-    previous_manifest = _load_previous_manifest(versions_dir, previous_version_id) if prune_missing else None
-    previous_tables = set(previous_manifest.get("tables", {})) if previous_manifest else set()
-
     for table in metadata.sorted_tables:
-        # Collect enum types so we can create them before tables
-        for col in table.columns:
-            if isinstance(col.type, sa.Enum):
-                name = col.type.name or f"{table.name}_{col.name}_enum"
-                enum_types[name] = col.type
-                col.type.name = name
+        if table.info.get("is_materialized"):
+            view_statements.extend(_materialized_view_ddl(table, dialect))
+            if table.primary_key.columns:  # CONCURRENTLY needs the unique pkey index
+                refresh_statements.append(
+                    f"REFRESH MATERIALIZED VIEW CONCURRENTLY {dialect.identifier_preparer.format_table(table)};"
+                )
+            # str(): names may be quoted_name, which orjson won't take as a dict key
+            manifest["tables"][str(table.name)] = {
+                "columns": [str(c.name) for c in table.columns],
+                "materialized": True
+            }
+            continue
+
+        rendered = _table_ddl(table, dialect)
+        statements.extend(rendered.create_sql)
+        alter_statements.extend(rendered.add_column_sql)
+        table_ddl.extend(table.info.get("ddl", ()))
+        manifest["tables"][str(table.name)] = {"columns": rendered.column_names}
+
+    # CREATE TYPE/DOMAIN have no IF NOT EXISTS; ignore types that already exist
+    type_sql = ["CREATE EXTENSION IF NOT EXISTS citext;"] if schema_types.uses_citext else []
+    for enum in schema_types.enums.values():
+        labels = "'" + "', '".join(v.replace("'", "''") for v in enum.enums) + "'"
+        type_sql.append(
+            f"DO $$ BEGIN CREATE TYPE {dialect.identifier_preparer.format_type(enum)} AS ENUM ({labels}); "
+            "EXCEPTION WHEN duplicate_object THEN NULL; END $$;"
+        )
+    for domain in schema_types.domains.values():
+        create_domain = _compile_ddl(dialect, postgresql.CreateDomainType(domain))
+        type_sql.append(f"DO $$ BEGIN {create_domain}; EXCEPTION WHEN duplicate_object THEN NULL; END $$;")
 
-        statements.append(str(CreateTable(table, if_not_exists=True).compile(dialect=dialect)).rstrip() + ";")
+    return {
+        "types": type_sql,
+        # drop statements for pruning go here, between types and tables
+        "body": statements + alter_statements + table_ddl + view_statements,
+        "refresh": refresh_statements,
+        "manifest": manifest,
+    }
 
-        table_ident = format_table(table)
-        for col in table.columns:
-            col_sql = str(CreateColumn(col).compile(dialect=dialect)).rstrip()
-            alter_statements.append(f"ALTER TABLE {table_ident} ADD COLUMN IF NOT EXISTS {col_sql};")
 
-        for idx in table.indexes:
-            statements.append(str(CreateIndex(idx, if_not_exists=True).compile(dialect=dialect)).rstrip() + ";")
+# Modules under these are never treated as dependencies of a models file
+_LIBRARY_DIRS = tuple({sysconfig.get_paths()[name] for name in ("stdlib", "platstdlib", "purelib", "platlib")})
 
-        manifest["tables"][table.name] = {
-            "columns": [c.name for c in table.columns]
-        }
 
+def _source_stamps() -> list[list]:
+    """[path, mtime_ns, size] of every loaded module outside the stdlib and site-packages."""
+    stamps = []
+    for module in list(sys.modules.values()):
+        path = getattr(module, "__file__", None)
+        if not path or path.startswith(_LIBRARY_DIRS):
+            continue
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        stamps.append([path, st.st_mtime_ns, st.st_size])
+    return sorted(stamps)
+
+
+def _stamps_current(stamps: list[list]) -> bool:
+    for path, mtime_ns, size in stamps:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return False
+        if st.st_mtime_ns != mtime_ns or st.st_size != size:
+            return False
+    return True
+
+
+def _compiled_models(module_path: Path, base_symbol: str, versions_dir: Path) -> dict:
+    """
+    _compile_models() result, persisted under versions_dir/.compiled so an unchanged
+    models file is never re-imported or re-rendered, even after a restart. Keyed on
+    the file's path, mtime and size, the Base symbol, the SQLAlchemy version and the
+    generation settings; an entry also records the project modules loaded when it was
+    compiled (mixins, enums, this package) and is discarded once any of them changes.
+    Writing an entry removes older ones for the same file and Base symbol.
+    """
+    settings = get_settings()
+    st = module_path.stat()
+    source = repr((str(module_path.resolve()), base_symbol))
+    key = repr((
+        COMPILED_FORMAT, source, st.st_mtime_ns, st.st_size, sa.__version__,
+        settings.refresh_materialized_views, settings.checksum_algorithm,
+    ))
+    prefix = hashlib.blake2b(source.encode(), digest_size=8).hexdigest()
+    cache_dir = versions_dir / COMPILED_DIR
+    cache_path = cache_dir / f"{prefix}-{hashlib.blake2b(key.encode(), digest_size=16).hexdigest()}.json"
+    if cache_path.exists():
+        entry = _loads(cache_path.read_bytes())
+        if _stamps_current(entry["sources"]):
+            return entry["compiled"]
+
+    compiled = _compile_models(module_path, base_symbol)
+    cache_dir.mkdir(exist_ok=True)
+    tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+    tmp_path.write_bytes(_dumps({"sources": _source_stamps(), "compiled": compiled}))
+    os.replace(tmp_path, cache_path)
+    for stale in cache_dir.glob(f"{prefix}-*.json"):
+        if stale != cache_path:
+            stale.unlink(missing_ok=True)
+    return compiled
+
+
+def _drop_statements(manifest: dict, previous_manifest: dict, dialect: sa.Dialect) -> list[str]:
+    """DROP statements for tables, views and columns present in previous_manifest but not in manifest."""
+    # quote() only adds quotes where needed and escapes embedded ones
+    quote = dialect.identifier_preparer.quote
+    drop_statements = []
+
+    current_tables = set(manifest["tables"].keys())
+    previous_tables = set(previous_manifest.get("tables", {}))
+    for tbl in sorted(previous_tables - current_tables):
+        if previous_manifest["tables"][tbl].get("materialized"):
+            drop_statements.append(f"DROP MATERIALIZED VIEW IF EXISTS {quote(tbl)} CASCADE;")
+        else:
+            drop_statements.append(f"DROP TABLE IF EXISTS {quote(tbl)} CASCADE;")
+
+    for tbl in sorted(current_tables & previous_tables):
+        if manifest["tables"][tbl].get("materialized"):
+            continue  # view columns follow the definition
+        old_cols = set(previous_manifest["tables"].get(tbl, {}).get("columns", []))
+        new_cols = set(manifest["tables"].get(tbl, {}).get("columns", []))
+        removed_cols = old_cols - new_cols
+        table_ident = quote(tbl)
+        for col in sorted(removed_cols):
+            drop_statements.append(f"ALTER TABLE IF EXISTS {table_ident} DROP COLUMN IF EXISTS {quote(col)} CASCADE;")
+    return drop_statements
+
+
+def generate_sql_from_models(
+    path: str,
+    base_symbol: str = "Base",
+    description: str = "models import",
+    prune_missing: bool = False,
+    previous_version_id: str | None = None
+) -> dict:
+    """
+    Dynamically load a SQLAlchemy model file and emit Postgres DDL as SQL.
+    No database connection is required.
+    If prune_missing is True, compare against the latest models manifest (or provided previous_version_id)
+    and emit DROP statements for removed tables/columns.
+    Tables flagged with info={"is_materialized": True} are emitted as materialized views
+    after all tables and columns exist, and refreshed concurrently at the end when
+    settings.refresh_materialized_views is on.
+    Raw statements in metadata.info["ddl"] (e.g. shared trigger functions) and then each
+    table's info["ddl"] (e.g. its triggers) run once tables and columns exist.
+    """
+    settings = get_settings()
+    versions_dir = Path(settings.sql_versions_dir)
+    versions_dir.mkdir(exist_ok=True)
+
+    module_path = Path(path)
+    if not module_path.exists():
+        raise FileNotFoundError(f"Model file not found: {module_path}")
+
+    compiled = _compiled_models(module_path, base_symbol, versions_dir)
+    manifest = compiled["manifest"]
+
+    drop_statements: list[str] = []
+    previous_manifest = _load_previous_manifest(versions_dir, previous_version_id) if prune_missing else None
     if previous_manifest:
-        current_tables = set(manifest["tables"].keys())
-        removed_tables = previous_tables - current_tables
-        for tbl in sorted(removed_tables):
-            drop_statements.append(f'DROP TABLE IF EXISTS "{tbl}" CASCADE;')
-
-        for tbl in sorted(current_tables & previous_tables):
-            old_cols = set(previous_manifest["tables"].get(tbl, {}).get("columns", []))
-            new_cols = set(manifest["tables"].get(tbl, {}).get("columns", []))
-            removed_cols = old_cols - new_cols
-            for col in sorted(removed_cols):
-                drop_statements.append(f'ALTER TABLE IF EXISTS "{tbl}" DROP COLUMN IF EXISTS "{col}" CASCADE;')
-
-    enum_sql = []
-    for name, enum in enum_types.items():
-        labels = ", ".join(f"'{v}'" for v in enum.enums)
-        enum_sql.append(f"CREATE TYPE {name} AS ENUM ({labels});")
-
-    upgrade_parts = ["BEGIN;"]
-    if enum_sql:
-        upgrade_parts.extend(enum_sql)
-    if drop_statements:
-        upgrade_parts.extend(drop_statements)
-    upgrade_parts.extend(statements)
-    upgrade_parts.extend(alter_statements)
-    upgrade_parts.append("COMMIT;")
-    upgrade_content = "\n\n".join(upgrade_parts) + "\n"
+        drop_statements = _drop_statements(manifest, previous_manifest, postgresql.dialect())
+
+    # One transaction; the list is built in a single pass instead of repeated extends
+    upgrade_parts = list(itertools.chain(
+        ("BEGIN;",),
+        compiled["types"],
+        drop_statements,
+        compiled["body"],
+        compiled["refresh"] if settings.refresh_materialized_views else (),
+        ("COMMIT;",),
+    ))
     downgrade_content = "-- Downgrade not implemented for model-generated SQL\n"
 
-    version_id = datetime.now().strftime("%Y%m%d_%H%M%S")
-    checksum = hashlib.sha256(upgrade_content.encode()).hexdigest()[:16]
-
-    version_path = versions_dir / version_id
-    version_path.mkdir(exist_ok=True)
+    version_id, version_path, created_at = _new_version_dir(versions_dir)
 
-    (version_path / "upgrade.sql").write_text(upgrade_content)
-    (version_path / "downgrade.sql").write_text(downgrade_content)
+    checksum = _write_parts(version_path / "upgrade.sql", upgrade_parts, settings.checksum_algorithm)
+    _write_buffers(version_path / "downgrade.sql", [downgrade_content.encode()])
 
     metadata_json = {
         "version_id": version_id,
         "revision_id": "models",
         "checksum": checksum,
+        "checksum_algorithm": settings.checksum_algorithm,
         "description": description,
-        "created_at": datetime.now().isoformat(),
+        "created_at": created_at,
         "manifest": manifest
     }
-    (version_path / "metadata.json").write_text(json.dumps(metadata_json, indent=2))
+    _write_buffers(version_path / "metadata.json", [_dumps(metadata_json, indent=True)])
+    _record_version(versions_dir, metadata_json)
 
     return {
         "success": True,
         "version_id": version_id,
         "checksum": checksum,
-        "upgrade_sql": upgrade_content,
+        "upgrade_sql": "\n\n".join(upgrade_parts) + "\n",
         "files": {
             "upgrade": str(version_path / "upgrade.sql"),
             "downgrade": str(version_path / "downgrade.sql")
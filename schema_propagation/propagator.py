@@ -1,5 +1,9 @@
 import asyncio
+import json
+import random
 import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import AsyncIterator
@@ -8,6 +12,11 @@ from uuid import uuid4
 import asyncpg
 import structlog
 
+try:
+    import redis.asyncio as redis
+except ImportError:  # only needed when REDIS_URL is set
+    redis = None
+
 from .config import get_settings
 
 log = structlog.get_logger()
@@ -20,6 +29,27 @@ CREATE TABLE IF NOT EXISTS schema_propagation_version (
 );
 """
 
+# Fixed statement texts, so asyncpg's per-connection statement cache can reuse them
+VERSION_EXISTS_SQL = "SELECT EXISTS (SELECT 1 FROM schema_propagation_version WHERE version_id = $1)"
+VERSION_CLAIM_SQL = (
+    "INSERT INTO schema_propagation_version (version_id, checksum) VALUES ($1, $2) "
+    "ON CONFLICT (version_id) DO NOTHING RETURNING true"
+)
+
+# Failures worth retrying: lost or refused connections, deadlock/serialization rollbacks, a
+# server that is starting up or out of connection slots. Anything else (e.g. a DDL error)
+# fails at once.
+RETRYABLE_ERRORS = (
+    ConnectionError,
+    asyncpg.PostgresConnectionError,
+    asyncpg.TransactionRollbackError,
+    asyncpg.CannotConnectNowError,
+    asyncpg.TooManyConnectionsError,
+)
+MAX_BACKOFF_SECONDS = 30
+# Most recent per-database errors kept per job; job.failed has the full count
+JOB_ERRORS_KEPT = 100
+
 
 class JobStatus(str, Enum):
     PENDING = "pending"
@@ -55,19 +85,269 @@ class PropagationJob:
     skipped: int = 0
     started_at: float = 0
     ended_at: float = 0
-    errors: list[dict] = field(default_factory=list)
+    errors: deque[dict] = field(default_factory=lambda: deque(maxlen=JOB_ERRORS_KEPT))
     stop_requested: bool = False
     db_timings: list[dict] = field(default_factory=list)
+    # Set (and replaced) on every progress change, so all waiting streams wake up
+    progress_event: asyncio.Event = field(default_factory=asyncio.Event, repr=False, compare=False)
 
+    def notify_progress(self) -> None:
+        self.progress_event.set()
+        self.progress_event = asyncio.Event()
 
-# In-memory job store (use Redis for production distributed workers)
+
+# Jobs run by this process. With REDIS_URL set, progress is also mirrored to a
+# job:{id} hash (and announced on job:{id}:progress) so every API worker can
+# report on and stop any job.
 _jobs: dict[str, PropagationJob] = {}
+_redis = None
+JOB_TTL_SECONDS = 86400
+JOB_MIRROR_TIMEOUT_SECONDS = 2
+# A running job's progress is mirrored at most this often; after a failed write the
+# mirror waits JOB_MIRROR_RETRY_SECONDS instead, so a Redis outage costs one timeout
+JOB_MIRROR_INTERVAL_SECONDS = 0.25
+JOB_MIRROR_RETRY_SECONDS = 30
+
+
+@dataclass
+class _PoolEntry:
+    future: asyncio.Future  # the future, not the pool, so concurrent callers share one creation
+    users: int = 0  # callers between lookup and release; the pool isn't closed under them
+    evicted: bool = False
+
+
+# Per-database pools, least recently used first; reused across jobs so repeat
+# propagations skip the connect/auth handshake
+_pools: OrderedDict[str, _PoolEntry] = OrderedDict()
+# Background pool closes, referenced until done
+_closing: set[asyncio.Task] = set()
+# Pool of direct connections to the admin database (catalog queries, CREATE/DROP DATABASE)
+_admin_pool: asyncio.Future | None = None
+
+
+async def _create_pool(dsn: str) -> asyncpg.Pool:
+    settings = get_settings()
+    # min_size=0: nothing connects until acquire(), and idle connections are closed after a minute
+    return await asyncpg.create_pool(
+        dsn, min_size=0, max_size=2, max_inactive_connection_lifetime=60,
+        command_timeout=settings.per_db_timeout_seconds, **settings.connect_kwargs()
+    )
+
+
+@asynccontextmanager
+async def tenant_connection(dsn: str) -> AsyncIterator[asyncpg.Connection]:
+    """
+    A connection from dsn's shared pool. Past tenant_pool_cache_size the least recently
+    used pools are evicted and closed in the background, once nobody is using them.
+    """
+    entry = _pools.get(dsn)
+    if entry is None:
+        entry = _pools[dsn] = _PoolEntry(asyncio.ensure_future(_create_pool(dsn)))
+    else:
+        _pools.move_to_end(dsn)
+    entry.users += 1
+    try:
+        _evict_pools()
+        try:
+            # Shielded: a caller's timeout mustn't cancel the creation other callers share
+            pool = await asyncio.shield(entry.future)
+        except BaseException:
+            if _failed(entry.future) and _pools.get(dsn) is entry:
+                del _pools[dsn]  # don't cache a failed connect
+            raise
+        async with pool.acquire() as conn:
+            yield conn
+    finally:
+        entry.users -= 1
+        if entry.evicted and not entry.users:
+            _close_in_background(entry.future)
+
+
+def _evict_pools() -> None:
+    while len(_pools) > get_settings().tenant_pool_cache_size:
+        _, entry = _pools.popitem(last=False)
+        entry.evicted = True
+        if not entry.users:
+            _close_in_background(entry.future)
+
+
+def _close_in_background(pool_future: asyncio.Future) -> None:
+    task = asyncio.ensure_future(_close_pool(pool_future))
+    _closing.add(task)
+    task.add_done_callback(_closing.discard)
+
+
+async def get_admin_pool() -> asyncpg.Pool:
+    """Shared pool over settings.direct_dsn; its size caps concurrent admin statements."""
+    global _admin_pool
+    if _admin_pool is None:
+        _admin_pool = asyncio.ensure_future(
+            asyncpg.create_pool(get_settings().direct_dsn, min_size=1, max_size=20)
+        )
+    admin_pool = _admin_pool
+    try:
+        return await asyncio.shield(admin_pool)
+    except BaseException:
+        if _failed(admin_pool) and _admin_pool is admin_pool:
+            _admin_pool = None  # don't cache a failed connect
+        raise
+
+
+def _failed(future: asyncio.Future) -> bool:
+    return future.done() and (future.cancelled() or future.exception() is not None)
+
+
+async def _close_pool(pool_future: asyncio.Future) -> None:
+    try:
+        pool = await pool_future
+    except Exception:
+        return
+    await pool.close()  # waits for acquired connections to be released
+
+
+async def close_pools() -> None:
+    """Close every cached pool (application shutdown)."""
+    global _admin_pool
+    if _admin_pool is not None:
+        admin_pool, _admin_pool = _admin_pool, None
+        await _close_pool(admin_pool)
+    while _pools:
+        _, entry = _pools.popitem()
+        await _close_pool(entry.future)
+    if _closing:
+        await asyncio.gather(*_closing)
 
 
 def get_job(job_id: str) -> PropagationJob | None:
     return _jobs.get(job_id)
 
 
+def _get_redis():
+    global _redis
+    url = get_settings().redis_url
+    if not url:
+        return None
+    if redis is None:
+        raise RuntimeError("REDIS_URL is set but the redis package is not installed")
+    if _redis is None:
+        _redis = redis.from_url(url, decode_responses=True)
+    return _redis
+
+
+def _job_fields(job: PropagationJob) -> dict:
+    # stop_requested is left out: it is only ever set by request_stop()
+    return {
+        "version_id": job.version_id,
+        "status": job.status.value,
+        "total": job.total,
+        "completed": job.completed,
+        "successful": job.successful,
+        "failed": job.failed,
+        "skipped": job.skipped,
+        "started_at": job.started_at,
+        "ended_at": job.ended_at,
+    }
+
+
+async def save_job(job: PropagationJob, errors: list[dict] = ()) -> bool:
+    """
+    Mirror job progress and new errors to Redis (no-op without REDIS_URL) in one
+    pipelined round trip, and pick up a stop requested through another worker.
+    Best effort: the mirror is a copy, so a Redis error or timeout is logged and
+    reported by returning False.
+    """
+    r = _get_redis()
+    if r is None:
+        return True
+    key = f"job:{job.job_id}"
+    try:
+        async with asyncio.timeout(JOB_MIRROR_TIMEOUT_SECONDS):
+            async with r.pipeline(transaction=False) as pipe:
+                pipe.hset(key, mapping=_job_fields(job))
+                pipe.expire(key, JOB_TTL_SECONDS)
+                if errors:
+                    pipe.rpush(f"{key}:errors", *(json.dumps(e) for e in errors))
+                    pipe.ltrim(f"{key}:errors", -JOB_ERRORS_KEPT, -1)
+                    pipe.expire(f"{key}:errors", JOB_TTL_SECONDS)
+                pipe.publish(f"{key}:progress", job.completed)
+                pipe.hget(key, "stop_requested")
+                *_, stop_requested = await pipe.execute()
+    except (redis.RedisError, OSError) as e:  # includes TimeoutError
+        log.warning("job_mirror_failed", job_id=job.job_id, error=str(e))
+        return False
+    if stop_requested == "1":
+        job.stop_requested = True
+    return True
+
+
+async def _mirror_progress(job: PropagationJob, pending_errors: list[dict], changed: asyncio.Event) -> None:
+    """Write a running job's progress in the background, coalescing the results in between."""
+    while True:
+        await changed.wait()
+        changed.clear()
+        sent = len(pending_errors)
+        if await save_job(job, pending_errors[:sent]):
+            del pending_errors[:sent]
+            await asyncio.sleep(JOB_MIRROR_INTERVAL_SECONDS)
+        else:
+            del pending_errors[:-JOB_ERRORS_KEPT]  # only the last JOB_ERRORS_KEPT are kept anyway
+            changed.set()  # retry what was missed
+            await asyncio.sleep(JOB_MIRROR_RETRY_SECONDS)
+
+
+async def load_job(job_id: str) -> PropagationJob | None:
+    """Job from this process, else a read-only snapshot from Redis (without per-db timings)."""
+    job = _jobs.get(job_id)
+    r = _get_redis()
+    if job is not None or r is None:
+        return job
+    key = f"job:{job_id}"
+    try:
+        async with asyncio.timeout(JOB_MIRROR_TIMEOUT_SECONDS):
+            async with r.pipeline(transaction=False) as pipe:
+                pipe.hgetall(key)
+                pipe.lrange(f"{key}:errors", 0, -1)
+                fields, errors = await pipe.execute()
+    except (redis.RedisError, OSError) as e:  # includes TimeoutError
+        log.warning("job_load_failed", job_id=job_id, error=str(e))
+        return None
+    if not fields:
+        return None
+    return PropagationJob(
+        job_id=job_id,
+        version_id=fields["version_id"],
+        status=JobStatus(fields["status"]),
+        total=int(fields["total"]),
+        completed=int(fields["completed"]),
+        successful=int(fields["successful"]),
+        failed=int(fields["failed"]),
+        skipped=int(fields["skipped"]),
+        started_at=float(fields["started_at"]),
+        ended_at=float(fields["ended_at"]),
+        errors=deque((json.loads(e) for e in errors), maxlen=JOB_ERRORS_KEPT),
+        stop_requested=fields.get("stop_requested") == "1",
+    )
+
+
+async def request_stop(job_id: str) -> bool:
+    """Ask a job to stop, wherever it runs. Returns False if the job is unknown."""
+    job = _jobs.get(job_id)
+    if job is not None:
+        job.stop_requested = True
+    r = _get_redis()
+    if r is None:
+        return job is not None
+    try:
+        async with asyncio.timeout(JOB_MIRROR_TIMEOUT_SECONDS):
+            if await r.exists(f"job:{job_id}"):
+                # The worker running the job reads this back on its next save_job()
+                await r.hset(f"job:{job_id}", "stop_requested", "1")
+                return True
+    except (redis.RedisError, OSError) as e:  # includes TimeoutError
+        log.warning("job_stop_mirror_failed", job_id=job_id, error=str(e))
+    return job is not None
+
+
 def create_job(version_id: str, total: int) -> PropagationJob:
     job = PropagationJob(
         job_id=f"prop_{uuid4().hex[:12]}",
@@ -79,18 +359,55 @@ def create_job(version_id: str, total: int) -> PropagationJob:
     return job
 
 
+def _backoff_delay(attempt: int) -> float:
+    """Full-jitter exponential backoff, so databases that failed together don't retry together."""
+    return random.uniform(0, min(MAX_BACKOFF_SECONDS, 2 ** attempt))
+
+
+async def _version_applied(conn: asyncpg.Connection, version_id: str) -> bool:
+    """
+    Idempotency check in one round trip. The version table is only created when the
+    check finds it missing, so databases seen before never re-run the DDL.
+    """
+    try:
+        return await conn.fetchval(VERSION_EXISTS_SQL, version_id)
+    except asyncpg.UndefinedTableError:
+        await conn.execute(VERSION_TABLE_SQL)
+        return False
+
+
+async def _apply_version(conn: asyncpg.Connection, sql: str, version_id: str, checksum: str) -> bool:
+    """
+    Record version_id and run sql in one transaction; False if it was already applied.
+    The version row is claimed first, so an applied version is skipped without running
+    sql, and a concurrent job applying the same version waits on the row lock, then skips.
+    """
+    async def claim_and_run() -> bool:
+        async with conn.transaction():
+            if not await conn.fetchval(VERSION_CLAIM_SQL, version_id, checksum):
+                return False
+            await conn.execute(sql)
+        return True
+
+    try:
+        return await claim_and_run()
+    except asyncpg.UndefinedTableError:
+        # First contact: create the version table and try again (if sql itself
+        # references a missing table, the second attempt fails the same way).
+        # There is no upfront bootstrap pass: the table persists in each tenant,
+        # so only a database's first migration ever pays for this.
+        await conn.execute(VERSION_TABLE_SQL)
+        return await claim_and_run()
+
+
 async def list_tenant_databases(pattern: str = "cmp_%") -> list[str]:
     """List all tenant databases matching pattern."""
-    settings = get_settings()
-    conn = await asyncpg.connect(settings.direct_dsn)
-    try:
-        rows = await conn.fetch(
-            "SELECT datname FROM pg_database WHERE datname LIKE $1 ORDER BY datname",
-            pattern.replace("*", "%")
-        )
-        return [r["datname"] for r in rows]
-    finally:
-        await conn.close()
+    pool = await get_admin_pool()
+    rows = await pool.fetch(
+        "SELECT datname FROM pg_database WHERE datname LIKE $1 ORDER BY datname",
+        pattern.replace("*", "%")
+    )
+    return [r["datname"] for r in rows]
 
 
 async def propagate(
@@ -105,116 +422,171 @@ async def propagate(
     """Propagate SQL to all databases concurrently."""
     settings = get_settings()
     max_conn = max_connections or settings.max_concurrent_connections
-    semaphore = asyncio.Semaphore(max_conn)
     job = job or create_job(version_id, len(databases))
     job.total = len(databases)
     job.status = JobStatus.IN_PROGRESS
 
+    async def apply_once(db: str) -> DBStatus:
+        # A fresh pooled connection per attempt: a dropped one is discarded by the pool
+        async with tenant_connection(settings.db_dsn(db)) as conn:
+            if dry_run:
+                # Idempotency check only (creates the version table on first contact)
+                applied = await _version_applied(conn, version_id)
+                return DBStatus.SKIPPED if applied else DBStatus.SUCCESS
+            # The idempotency check is part of the transaction, so a retry is safe
+            applied = await _apply_version(conn, sql, version_id, checksum)
+            return DBStatus.SUCCESS if applied else DBStatus.SKIPPED
+
     async def process_db(db: str) -> DBResult:
         start = time.perf_counter()
-        async with semaphore:
-            if job.stop_requested:
-                return DBResult(db, DBStatus.SKIPPED)
-            try:
-                conn = await asyncpg.connect(settings.db_dsn(db))
-                try:
-                    # Ensure version table exists
-                    await conn.execute(VERSION_TABLE_SQL)
-                    
-                    # Idempotency check
-                    exists = await conn.fetchval(
-                        "SELECT 1 FROM schema_propagation_version WHERE version_id = $1",
-                        version_id
-                    )
-                    if exists:
-                        return DBResult(db, DBStatus.SKIPPED, duration_ms=(time.perf_counter() - start) * 1000)
-
-                    if dry_run:
-                        return DBResult(db, DBStatus.SUCCESS, duration_ms=(time.perf_counter() - start) * 1000)
-
-                    # Execute with retry
-                    for attempt in range(settings.max_retries):
-                        try:
-                            async with conn.transaction():
-                                await conn.execute(sql)
-                                await conn.execute(
-                                    "INSERT INTO schema_propagation_version (version_id, checksum) VALUES ($1, $2)",
-                                    version_id, checksum
-                                )
-                            return DBResult(db, DBStatus.SUCCESS, duration_ms=(time.perf_counter() - start) * 1000)
-                        except asyncpg.PostgresError as e:
-                            if attempt == settings.max_retries - 1:
-                                raise
-                            await asyncio.sleep(1 * (2 ** attempt))
-                finally:
-                    await conn.close()
-            except Exception as e:
-                return DBResult(db, DBStatus.FAILED, str(e), (time.perf_counter() - start) * 1000)
-
-    tasks = [asyncio.create_task(process_db(db)) for db in databases]
-    
-    for coro in asyncio.as_completed(tasks):
-        result = await coro
-        job.completed += 1
-        
-        if result.status == DBStatus.SUCCESS:
-            job.successful += 1
-        elif result.status == DBStatus.SKIPPED:
-            job.skipped += 1
-        else:
-            job.failed += 1
-            job.errors.append({"database": result.database, "error": result.error})
-        
-        job.db_timings.append({
-            "database": result.database,
-            "status": result.status.value,
-            "duration_ms": round(result.duration_ms, 2)
-        })
-        
-        # Error threshold circuit breaker
-        if job.total > 0:
-            error_pct = (job.failed / job.total) * 100
-            if error_pct > settings.error_threshold_percent and job.completed > 10:
-                job.stop_requested = True
-                log.warning("error_threshold_exceeded", pct=error_pct)
-
-    job.status = JobStatus.COMPLETED if not job.stop_requested else JobStatus.STOPPED
-    if job.failed > 0 and job.successful == 0:
+        if job.stop_requested:
+            return DBResult(db, DBStatus.SKIPPED)
+        try:
+            # Total budget per database, including retries; cancelling also cancels
+            # the running statement on the server
+            async with asyncio.timeout(settings.per_db_timeout_seconds):
+                for attempt in range(settings.max_retries):
+                    try:
+                        status = await apply_once(db)
+                        return DBResult(db, status, duration_ms=(time.perf_counter() - start) * 1000)
+                    except RETRYABLE_ERRORS:
+                        if attempt == settings.max_retries - 1:
+                            raise
+                        await asyncio.sleep(_backoff_delay(attempt))
+        except TimeoutError:
+            return DBResult(db, DBStatus.FAILED, "timeout", (time.perf_counter() - start) * 1000)
+        except Exception as e:
+            return DBResult(db, DBStatus.FAILED, str(e), (time.perf_counter() - start) * 1000)
+
+    # A fixed set of workers pulls from one shared iterator, so only max_conn tasks
+    # exist however many databases there are; results are aggregated as they arrive.
+    # Every tenant is reached through the one pgbouncer endpoint in settings, so there
+    # is no per-host split: pgbouncer spreads server connections itself.
+    results: asyncio.Queue[DBResult] = asyncio.Queue()
+    pending = iter(databases)
+
+    async def worker() -> None:
+        for db in pending:
+            await results.put(await process_db(db))
+
+    # Redis writes happen off the result path; pending_errors holds errors not yet mirrored
+    pending_errors: list[dict] = []
+    changed = asyncio.Event()
+    mirror = asyncio.create_task(_mirror_progress(job, pending_errors, changed)) if _get_redis() else None
+
+    # The final status is recorded however the run ends, so the job never stays IN_PROGRESS
+    try:
+        await save_job(job)
+        async with asyncio.TaskGroup() as tg:
+            for _ in range(min(max_conn, len(databases))):
+                tg.create_task(worker())
+
+            for _ in range(len(databases)):
+                result = await results.get()
+                job.completed += 1
+                error = None
+
+                if result.status == DBStatus.SUCCESS:
+                    job.successful += 1
+                elif result.status == DBStatus.SKIPPED:
+                    job.skipped += 1
+                else:
+                    job.failed += 1
+                    error = {"database": result.database, "error": result.error}
+                    job.errors.append(error)
+
+                job.db_timings.append({
+                    "database": result.database,
+                    "status": result.status.value,
+                    "duration_ms": round(result.duration_ms, 2)
+                })
+
+                # Error threshold circuit breaker. failed/total only grows on a failure, so
+                # check then (and once when the 10-result minimum is reached), without division
+                if job.completed > 10 and (error or job.completed == 11) and not job.stop_requested:
+                    if job.failed * 100 > settings.error_threshold_percent * job.total:
+                        job.stop_requested = True
+                        log.warning("error_threshold_exceeded", failed=job.failed, total=job.total)
+
+                job.notify_progress()
+                if error:
+                    pending_errors.append(error)
+                changed.set()
+    except BaseException:
         job.status = JobStatus.FAILED
-    
-    job.ended_at = time.time()
-    
+        raise
+    else:
+        job.status = JobStatus.COMPLETED if not job.stop_requested else JobStatus.STOPPED
+        if job.failed > 0 and job.successful == 0:
+            job.status = JobStatus.FAILED
+    finally:
+        if mirror is not None:
+            mirror.cancel()
+            await asyncio.wait([mirror])  # so no stale write lands after the final one
+        job.ended_at = time.time()
+        job.notify_progress()
+        await save_job(job, pending_errors[-JOB_ERRORS_KEPT:])
+
     return job
 
 
 async def stream_job_progress(job_id: str) -> AsyncIterator[dict]:
     """Yield job progress updates for SSE streaming."""
-    while True:
-        job = get_job(job_id)
-        if not job:
-            yield {"error": "Job not found"}
-            break
-        
-        reference_time = job.ended_at or time.time()
-        elapsed = reference_time - job.started_at if job.started_at else 0
-        rate = job.completed / elapsed if elapsed > 0 else 0
-        remaining = job.total - job.completed
-        eta = remaining / rate if rate > 0 else 0
-
-        yield {
-            "job_id": job.job_id,
-            "status": job.status,
-            "total": job.total,
-            "completed": job.completed,
-            "successful": job.successful,
-            "failed": job.failed,
-            "skipped": job.skipped,
-            "rate": f"{rate:.1f} db/s",
-            "eta_seconds": int(eta),
-            "elapsed_ms": int(elapsed * 1000)
-        }
-        
-        if job.status in (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.STOPPED):
-            break
-        
-        await asyncio.sleep(0.5)
+    # Jobs running in another worker announce progress over Redis pub/sub
+    pubsub = None
+    r = _get_redis()
+    if r is not None and job_id not in _jobs:
+        pubsub = r.pubsub()
+        try:
+            async with asyncio.timeout(JOB_MIRROR_TIMEOUT_SECONDS):
+                await pubsub.subscribe(f"job:{job_id}:progress")
+        except (redis.RedisError, OSError) as e:  # includes TimeoutError
+            # Without the subscription, the job is re-read every 5s instead
+            log.warning("job_subscribe_failed", job_id=job_id, error=str(e))
+            await pubsub.aclose()
+            pubsub = None
+    try:
+        while True:
+            job = await load_job(job_id)
+            if not job:
+                yield {"error": "Job not found"}
+                break
+            # Taken before the snapshot, so a change while it is being sent still wakes us
+            progress = job.progress_event
+
+            reference_time = job.ended_at or time.time()
+            elapsed = reference_time - job.started_at if job.started_at else 0
+            rate = job.completed / elapsed if elapsed > 0 else 0
+            remaining = job.total - job.completed
+            eta = remaining / rate if rate > 0 else 0
+
+            yield {
+                "job_id": job.job_id,
+                "status": job.status,
+                "total": job.total,
+                "completed": job.completed,
+                "successful": job.successful,
+                "failed": job.failed,
+                "skipped": job.skipped,
+                "rate": f"{rate:.1f} db/s",
+                "eta_seconds": int(eta),
+                "elapsed_ms": int(elapsed * 1000)
+            }
+
+            if job.status in (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.STOPPED):
+                break
+
+            if pubsub is None:
+                try:
+                    await asyncio.wait_for(progress.wait(), timeout=5.0)
+                except TimeoutError:
+                    pass
+                continue
+            # Wait for the next announcement (re-read anyway after 5s), then skip any
+            # backlog: the snapshot loaded above is always current
+            await pubsub.get_message(ignore_subscribe_messages=True, timeout=5.0)
+            while await pubsub.get_message(ignore_subscribe_messages=True, timeout=0):
+                pass
+    finally:
+        if pubsub is not None:
+            await pubsub.aclose()
@@ -1,4 +1,5 @@
 import asyncio
+import itertools
 import time
 from uuid import uuid4
 
@@ -6,9 +7,9 @@ from fastapi import APIRouter, BackgroundTasks, HTTPException
 from pydantic import BaseModel
 from sse_starlette.sse import EventSourceResponse
 
-from .generator import generate_sql, generate_sql_from_models, get_version, list_versions
+from .generator import generate_sql, generate_sql_from_models, get_version, list_versions, sql_checksum
 from .propagator import (
-    get_job, list_tenant_databases, propagate, stream_job_progress, JobStatus
+    get_job, list_tenant_databases, load_job, propagate, request_stop, save_job, stream_job_progress, JobStatus
 )
 from .simulator import create_test_databases, cleanup_test_databases
 
@@ -64,6 +65,9 @@ SAMPLE_SQL = {
         CREATE INDEX IF NOT EXISTS idx_audit_ts ON audit_log(ts);
     """
 }
+# Collapse whitespace once so every tenant is sent the compact text, and checksum it once
+SAMPLE_SQL = {name: " ".join(sql.split()) for name, sql in SAMPLE_SQL.items()}
+SAMPLE_CHECKSUMS = {name: sql_checksum(sql) for name, sql in SAMPLE_SQL.items()}
 
 
 # Background propagation task
@@ -127,6 +131,7 @@ async def start_propagation(request: PropagateRequest, background_tasks: Backgro
 
     from .propagator import create_job
     job = create_job(request.version_id, len(databases))
+    await save_job(job)
 
     background_tasks.add_task(
         run_propagation,
@@ -163,6 +168,7 @@ async def propagate_from_models(request: PropagateFromModelsRequest, background_
 
     from .propagator import create_job
     job = create_job(generation["version_id"], len(databases))
+    await save_job(job)
 
     background_tasks.add_task(
         run_propagation,
@@ -186,7 +192,7 @@ async def propagate_from_models(request: PropagateFromModelsRequest, background_
 
 @router.get("/propagate/{job_id}")
 async def get_propagation_status(job_id: str):
-    job = get_job(job_id)
+    job = await load_job(job_id)
     if not job:
         raise HTTPException(404, "Job not found")
     
@@ -212,13 +218,13 @@ async def get_propagation_status(job_id: str):
             "elapsed_ms": int(elapsed * 1000),
             "per_db": job.db_timings[: job.total or 10]  # small safety slice
         },
-        "errors": job.errors[:10]  # Limit to 10
+        "errors": list(itertools.islice(job.errors, 10))  # Limit to 10
     }
 
 
 @router.get("/propagate/{job_id}/stream")
 async def stream_progress(job_id: str):
-    if not get_job(job_id):
+    if not await load_job(job_id):
         raise HTTPException(404, "Job not found")
     
     async def generate():
@@ -230,16 +236,17 @@ async def stream_progress(job_id: str):
 
 @router.post("/propagate/{job_id}/stop")
 async def stop_propagation(job_id: str):
-    job = get_job(job_id)
-    if not job:
+    if not await request_stop(job_id):
         raise HTTPException(404, "Job not found")
-    job.stop_requested = True
     return {"status": "stop_requested"}
 
 
 @router.post("/simulate/create")
 async def simulate_create(request: SimulateRequest):
-    dbs = await create_test_databases(request.count, request.prefix, request.start_id, request.template_db)
+    try:
+        dbs = await create_test_databases(request.count, request.prefix, request.start_id, request.template_db)
+    except ValueError as e:
+        raise HTTPException(400, str(e))
     return {"created": len(dbs), "databases": dbs[:20]}
 
 
@@ -259,11 +266,12 @@ async def run_benchmark(request: BenchmarkRequest):
         test_dbs = await create_test_databases(db_count, prefix="bench_")
 
         for schema_type in request.schema_types:
-            sql = SAMPLE_SQL.get(schema_type, SAMPLE_SQL["add_column"])
+            sample = schema_type if schema_type in SAMPLE_SQL else "add_column"
+            sql = SAMPLE_SQL[sample]
             version_id = f"bench_{uuid4().hex[:8]}"
 
             start = time.perf_counter()
-            await propagate(sql, version_id, "benchtest", test_dbs, request.max_connections, dry_run=False)
+            await propagate(sql, version_id, SAMPLE_CHECKSUMS[sample], test_dbs, request.max_connections, dry_run=False)
             duration = time.perf_counter() - start
 
             results.append({
@@ -1,6 +1,23 @@
 import asyncio
+import re
+
 import asyncpg
-from .config import get_settings
+import structlog
+
+from .propagator import get_admin_pool
+
+log = structlog.get_logger()
+
+_IDENT_RE = re.compile(r"[A-Za-z0-9_]{1,63}")
+# CREATE/DROP DATABASE statements in flight at once, one admin pool connection each
+ADMIN_CONCURRENCY = 20
+
+
+def _quote_ident(name: str) -> str:
+    """Quote a database name for DDL (which can't take bind parameters); only [A-Za-z0-9_] is accepted."""
+    if not _IDENT_RE.fullmatch(name):
+        raise ValueError(f"Invalid database name: {name!r}")
+    return f'"{name}"'
 
 
 async def create_test_databases(
@@ -10,53 +27,54 @@ async def create_test_databases(
     template_db: str | None = None
 ) -> list[str]:
     """Create test databases for benchmarking."""
-    settings = get_settings()
-    semaphore = asyncio.Semaphore(20)
-    created = []
-
-    async def create_one(db_name: str) -> str | None:
-        async with semaphore:
-            conn = await asyncpg.connect(settings.direct_dsn)
-            try:
-                if template_db:
-                    await conn.execute(f'CREATE DATABASE "{db_name}" TEMPLATE "{template_db}"')
-                else:
-                    await conn.execute(f'CREATE DATABASE "{db_name}"')
-                return db_name
-            except asyncpg.DuplicateDatabaseError:
-                return db_name  # Already exists
-            except Exception:
-                return None
-            finally:
-                await conn.close()
-
     names = [f"{prefix}{start_id + i}" for i in range(count)]
-    results = await asyncio.gather(*[create_one(n) for n in names])
-    return [r for r in results if r]
+    # Validate everything before creating anything
+    statements = [f"CREATE DATABASE {_quote_ident(n)}" for n in names]
+    if template_db:
+        template = _quote_ident(template_db)
+        statements = [f"{stmt} TEMPLATE {template}" for stmt in statements]
+    pool = await get_admin_pool()
+    created = set()
+
+    async def create_from(pending) -> None:
+        # Each worker holds one admin connection and issues its statements back to back
+        async with pool.acquire() as conn:
+            for db_name, stmt in pending:
+                try:
+                    await conn.execute(stmt)
+                except asyncpg.DuplicateDatabaseError:
+                    pass  # Already exists
+                except Exception as e:
+                    log.warning("create_database_failed", database=db_name, error=str(e))
+                    continue
+                created.add(db_name)
+
+    await _run_workers(create_from, zip(names, statements), len(names))
+    return [n for n in names if n in created]
 
 
 async def cleanup_test_databases(databases: list[str]) -> int:
     """Remove test databases."""
-    settings = get_settings()
-    semaphore = asyncio.Semaphore(20)
+    pool = await get_admin_pool()
     removed = 0
 
-    async def drop_one(db_name: str) -> bool:
-        async with semaphore:
-            conn = await asyncpg.connect(settings.direct_dsn)
-            try:
-                # Terminate connections
-                await conn.execute(f"""
-                    SELECT pg_terminate_backend(pid) 
-                    FROM pg_stat_activity 
-                    WHERE datname = '{db_name}' AND pid <> pg_backend_pid()
-                """)
-                await conn.execute(f'DROP DATABASE IF EXISTS "{db_name}"')
-                return True
-            except Exception:
-                return False
-            finally:
-                await conn.close()
-
-    results = await asyncio.gather(*[drop_one(db) for db in databases])
-    return sum(results)
+    async def drop_from(pending) -> None:
+        nonlocal removed
+        async with pool.acquire() as conn:
+            for db_name in pending:
+                try:
+                    # FORCE (Postgres 13+) terminates remaining sessions in the same statement
+                    await conn.execute(f"DROP DATABASE IF EXISTS {_quote_ident(db_name)} WITH (FORCE)")
+                    removed += 1
+                except Exception as e:
+                    log.warning("drop_database_failed", database=db_name, error=str(e))
+
+    await _run_workers(drop_from, iter(databases), len(databases))
+    return removed
+
+
+async def _run_workers(work, pending, count: int) -> None:
+    """Run up to ADMIN_CONCURRENCY copies of work, all pulling from the one pending iterator."""
+    async with asyncio.TaskGroup() as tg:
+        for _ in range(min(ADMIN_CONCURRENCY, count)):
+            tg.create_task(work(pending))